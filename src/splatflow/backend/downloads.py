@@ -2,13 +2,41 @@ from __future__ import annotations
 
 import io
 import os
+import shutil
+import struct
+import sys
 import tarfile
+import threading
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Mapping
 
 import requests
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from .paths import ensure_dir
+
+# requests/urllib3 throughput plateaus around 100-200 KiB per read; larger chunks
+# only add allocation and copy cost.
+_STREAM_BUFSIZE = 128 * 1024
+_COPY_BUFSIZE = 1024 * 1024
+# below this, one connection is as fast as several
+_PARALLEL_MIN_BYTES = 50 * 1024 * 1024
+
+# a dropped connection surfaces from urllib3 directly or, mid-member, from bz2/tarfile
+_TAR_STREAM_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    Urllib3HTTPError,
+    EOFError,
+    tarfile.ReadError,
+)
+
+# file -> file sendfile is only reliable on Linux (macOS requires a socket as output)
+_SENDFILE_FILES = sys.platform.startswith("linux") and hasattr(os, "sendfile")
 
 
 @dataclass(frozen=True)
@@ -18,45 +46,342 @@ class DownloadResult:
     bytes: int
 
 
-def download_file(url: str, dest: Path, *, timeout_s: int = 60) -> DownloadResult:
-    dest.parent.mkdir(parents=True, exist_ok=True)
+def download_file(
+    url: str, dest: Path, *, timeout_s: int = 60, retries: int = 3, connections: int = 4
+) -> DownloadResult:
+    """Stream ``url`` to ``dest`` with constant memory.
+
+    Large files on servers that accept byte ranges are fetched over several
+    connections in parallel. Dropped connections are retried; when the server
+    supports byte ranges the download resumes where it stopped instead of
+    starting over.
+    """
+    ensure_dir(dest.parent)
+    if connections > 1:
+        probe = _probe_ranged(url, timeout_s)
+        if probe is not None and probe[1] >= _PARALLEL_MIN_BYTES:
+            final_url, size, validator = probe
+            try:
+                _download_ranges(final_url, dest, size, validator, connections, timeout_s)
+            except (requests.RequestException, Urllib3HTTPError, OSError):
+                pass  # fall back to a single stream below
+            else:
+                return DownloadResult(url=url, path=dest, bytes=size)
+
+    with open(dest, "wb") as f:
+        # decided by the first full response and kept across failed attempts, so a
+        # retry that can't even connect doesn't throw away what was downloaded
+        validator: str | None = None
+        resumable = False
+        expected: int | None = None
+        for attempt in range(retries + 1):
+            offset = f.tell()
+            # If-Range: the server sends the whole (new) file instead of a range
+            # if the asset changed since the bytes we already have
+            headers = None
+            if offset and resumable:
+                headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+            try:
+                with requests.get(url, stream=True, timeout=timeout_s, headers=headers) as r:
+                    if r.status_code == 416 and offset and offset == expected:
+                        break  # the connection dropped after the last byte
+                    r.raise_for_status()
+                    if offset and r.status_code != 206:
+                        # range ignored or asset changed: start over
+                        f.seek(0)
+                        f.truncate()
+                    if not f.tell():
+                        _preallocate(f, r.headers.get("Content-Length"))
+                        validator = _validator(r.headers)
+                        # byte offsets only line up with what we wrote if nothing is decoded
+                        resumable = validator is not None and not r.headers.get("Content-Encoding")
+                        expected = _content_length(r.headers)
+                    r.raw.decode_content = True
+                    shutil.copyfileobj(r.raw, f, _STREAM_BUFSIZE)
+                break
+            except (requests.ConnectionError, requests.Timeout, Urllib3HTTPError):
+                if attempt == retries:
+                    raise
+                if not resumable:
+                    f.seek(0)
+                    f.truncate()
+        total = f.tell()
+        f.truncate(total)
+    return DownloadResult(url=url, path=dest, bytes=total)
+
+
+def _content_length(headers: Mapping[str, str]) -> int | None:
+    try:
+        return int(headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _validator(headers: Mapping[str, str]) -> str | None:
+    """Strong ETag or Last-Modified, usable as an If-Range value."""
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+def _probe_ranged(url: str, timeout_s: int) -> tuple[str, int, str | None] | None:
+    """(final URL after redirects, size, If-Range validator) if the server serves plain byte ranges."""
+    try:
+        r = requests.head(url, allow_redirects=True, timeout=timeout_s)
+    except requests.RequestException:
+        return None
+    if not r.ok or r.headers.get("Accept-Ranges") != "bytes" or r.headers.get("Content-Encoding"):
+        return None
+    size = _content_length(r.headers)
+    return None if size is None else (r.url, size, _validator(r.headers))
+
+
+def _download_ranges(
+    url: str, dest: Path, size: int, validator: str | None, connections: int, timeout_s: int
+) -> None:
+    with open(dest, "wb") as f:
+        f.truncate(size)
+
+    step = -(-size // connections)
+    ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+    def fetch(span: tuple[int, int]) -> None:
+        start, end = span
+        headers = {"Range": f"bytes={start}-{end}"}
+        if validator:
+            # a changed asset answers 200 instead of 206, which aborts below
+            headers["If-Range"] = validator
+        with requests.get(url, stream=True, timeout=timeout_s, headers=headers) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise OSError(f"Server ignored range request for {url}")
+            # each worker has its own handle, so seek/write never interleave
+            with open(dest, "r+b") as out:
+                out.seek(start)
+                shutil.copyfileobj(r.raw, out, _STREAM_BUFSIZE)
+                if out.tell() != end + 1:
+                    raise OSError(f"Short read for bytes {start}-{end} of {url}")
+
+    with ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+        for _ in ex.map(fetch, ranges):
+            pass
+
+
+def _preallocate(f: io.BufferedWriter, length: str | None) -> None:
+    # Reserve the blocks up front to limit fragmentation of large archives.
+    if not length or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, int(length))
+    except (OSError, ValueError):
+        pass
+
+
+def download_and_extract_tar_bz2(
+    url: str, dest: Path, *, member: str, timeout_s: int = 60, retries: int = 3
+) -> None:
+    """Stream ``member`` of a .tar.bz2 at ``url`` to ``dest`` without saving the archive.
+
+    The member is written next to ``dest`` and moved into place only once it is
+    complete, so an interrupted download never leaves a truncated ``dest``. A
+    dropped connection restarts the stream (a bz2 stream can't be resumed).
+    """
+    part = dest.with_name(dest.name + ".part")
+    ensure_dir(dest.parent)
+    found = False
+    for attempt in range(retries + 1):
+        try:
+            found = _stream_tar_member(url, member, part, timeout_s)
+            break
+        except _TAR_STREAM_ERRORS:
+            part.unlink(missing_ok=True)
+            if attempt == retries:
+                raise
+    if not found:
+        raise KeyError(f"filename {member!r} not found in {url}")
+    _make_executable(part)
+    os.replace(part, dest)
+
+
+def _stream_tar_member(url: str, member: str, out_path: Path, timeout_s: int) -> bool:
     with requests.get(url, stream=True, timeout=timeout_s) as r:
         r.raise_for_status()
-        total = 0
-        with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 1024):
-                if chunk:
-                    f.write(chunk)
-                    total += len(chunk)
-    return DownloadResult(url=url, path=dest, bytes=total)
+        r.raw.decode_content = True
+        buf = io.BufferedReader(r.raw, buffer_size=_STREAM_BUFSIZE)
+        with tarfile.open(fileobj=buf, mode="r|bz2") as tf:
+            for m in tf:
+                if m.name != member:
+                    continue
+                src = tf.extractfile(m)
+                if src is None:
+                    return False
+                with src, open(out_path, "wb") as out:
+                    shutil.copyfileobj(src, out, _COPY_BUFSIZE)
+                    if out.tell() != m.size:
+                        raise EOFError(f"{member!r} ended early in {url}")
+                return True
+    return False
+
+
+def extract_zip(archive: Path, dest_dir: Path) -> list[str]:
+    """Extract ``archive`` into ``dest_dir`` and return the written files, relative to it.
+
+    Paths are POSIX-style and in archive order. They differ from the member
+    names where zipfile had to sanitize one (``..``, drive letters, absolute paths).
+    """
+    ensure_dir(dest_dir)
+    written: list[str] = []  # archive order
+    with zipfile.ZipFile(archive, "r") as z, open(archive, "rb") as raw:
+        _prefetch(raw.fileno())
+        files: list[zipfile.ZipInfo] = []
+        for info in z.infolist():
+            if info.is_dir():
+                z.extract(info, dest_dir)
+            elif not _is_plain_member_name(info.filename):
+                out = Path(z.extract(info, dest_dir))
+                written.append(out.relative_to(dest_dir).as_posix())
+            else:
+                written.append(info.filename)
+                # create parents up front so workers never race on makedirs
+                ensure_dir((dest_dir / info.filename).parent)
+                files.append(info)
+
+        if len(files) < 2:
+            for info in files:
+                _extract_zip_member(z, info, dest_dir, raw.fileno())
+        else:
+            _extract_zip_parallel(archive, files, dest_dir, raw.fileno())
+    return written
+
+
+def _extract_zip_parallel(archive: Path, infos: list[zipfile.ZipInfo], dest_dir: Path, raw_fd: int) -> None:
+    # zlib releases the GIL while inflating. Each worker gets its own ZipFile so
+    # no file position or reference count is shared between threads.
+    local = threading.local()
+    opened: list[zipfile.ZipFile] = []
+
+    def work(info: zipfile.ZipInfo) -> None:
+        z = getattr(local, "zip", None)
+        if z is None:
+            z = local.zip = zipfile.ZipFile(archive, "r")
+            opened.append(z)
+        _extract_zip_member(z, info, dest_dir, raw_fd)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as ex:
+            for _ in ex.map(work, infos):
+                pass
+    finally:
+        for z in opened:
+            z.close()
+
+
+def _extract_zip_member(z: zipfile.ZipFile, info: zipfile.ZipInfo, dest_dir: Path, raw_fd: int) -> None:
+    # only plain member names: extract_zip hands the rest to zipfile itself
+    with open(dest_dir / info.filename, "w+b") as out:
+        if _SENDFILE_FILES and info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1:
+            # stored, unencrypted: copy kernel-side straight out of the archive, then
+            # do the CRC check zipfile would have done (the copy is still in page cache)
+            _sendfile_all(out.fileno(), raw_fd, _zip_data_offset(raw_fd, info), info.file_size)
+            if _crc32_fd(out.fileno(), info.file_size) != info.CRC:
+                raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+        else:
+            with z.open(info) as src:
+                shutil.copyfileobj(src, out, _COPY_BUFSIZE)
 
 
-def extract_tar_bz2_member(archive: Path, member: str, dest: Path) -> None:
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    with tarfile.open(archive, mode="r:bz2") as tf:
-        m = tf.getmember(member)
-        with tf.extractfile(m) as src:
-            assert src is not None
-            with open(dest, "wb") as out:
-                out.write(src.read())
-    _make_executable(dest)
+def _prefetch(fd: int) -> None:
+    # Start asynchronous readahead of the whole archive into the page cache; every
+    # worker handle (and sendfile) then reads from memory instead of the disk.
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
 
 
-def extract_zip(archive: Path, dest_dir: Path) -> None:
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(archive, "r") as z:
-        z.extractall(dest_dir)
+def _is_plain_member_name(name: str) -> bool:
+    if name.startswith("/") or "\\" in name or ":" in name:
+        return False
+    return all(part not in ("", ".", "..") for part in name.split("/"))
 
 
-def find_files(root: Path, names: Iterable[str]) -> list[Path]:
-    wanted = {n.lower() for n in names}
+def _zip_data_offset(raw_fd: int, info: zipfile.ZipInfo) -> int:
+    # The local header's name/extra lengths can differ from the central directory's.
+    header = os.pread(raw_fd, zipfile.sizeFileHeader, info.header_offset)
+    fields = struct.unpack(zipfile.structFileHeader, header)
+    if fields[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename!r}")
+    name_len, extra_len = fields[-2], fields[-1]
+    return info.header_offset + zipfile.sizeFileHeader + name_len + extra_len
+
+
+def _sendfile_all(out_fd: int, in_fd: int, offset: int, count: int) -> None:
+    while count > 0:
+        sent = os.sendfile(out_fd, in_fd, offset, count)
+        if sent == 0:
+            raise zipfile.BadZipFile("Unexpected end of archive data")
+        offset += sent
+        count -= sent
+
+
+def _crc32_fd(fd: int, size: int) -> int:
+    crc = offset = 0
+    while offset < size:
+        chunk = os.pread(fd, min(_COPY_BUFSIZE, size - offset), offset)
+        if not chunk:
+            break
+        crc = zlib.crc32(chunk, crc)
+        offset += len(chunk)
+    return crc
+
+
+def find_member(names: Iterable[str], basenames: Iterable[str]) -> str | None:
+    """First archive member whose file name matches one of ``basenames`` (case-insensitive)."""
+    wanted = frozenset(n.lower() for n in basenames)
+    for name in names:
+        if name.rstrip("/").rpartition("/")[2].lower() in wanted:
+            return name
+    return None
+
+
+def find_files(root: Path, names: Iterable[str], *, first_match_per_name: bool = True) -> list[Path]:
+    """Find files under ``root`` whose name matches one of ``names`` (case-insensitive).
+
+    By default only the first hit per name is kept and the walk stops as soon as
+    every name has been found.
+    """
+    wanted = frozenset(n.lower() for n in names)
+    remaining = set(wanted)
     matches: list[Path] = []
-    for p in root.rglob("*"):
-        if p.is_file() and p.name.lower() in wanted:
-            matches.append(p)
+    for entry in _scandir_files(root):
+        name = entry.name.lower()
+        if name not in wanted:
+            continue
+        if first_match_per_name:
+            if name not in remaining:
+                continue
+            remaining.discard(name)
+        matches.append(Path(entry.path))
+        if first_match_per_name and not remaining:
+            break
     return matches
 
 
+def _scandir_files(root: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    # DirEntry caches the type from the directory read, so no extra stat() per file.
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except (FileNotFoundError, PermissionError):
+        return
+
+
 def _make_executable(path: Path) -> None:
     if os.name != "nt":
         mode = path.stat().st_mode
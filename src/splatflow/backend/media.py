@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+# ISO base media containers whose frame rate can be read straight from the boxes
+MP4_EXTS = frozenset({".mp4", ".mov", ".m4v"})
+
+
+def mp4_video_fps(path: Path) -> float | None:
+    """Mean frame rate of the first video track of an MP4/MOV file, or None.
+
+    Reads only box headers plus the track's ``mdhd`` and ``stts`` boxes:
+    fps = sample_count * timescale / total_sample_ticks.
+    """
+    try:
+        with open(path, "rb") as f:
+            return _mp4_video_fps(f)
+    except (OSError, struct.error, ValueError):
+        return None
+
+
+def _mp4_video_fps(f: BinaryIO) -> float | None:
+    end = f.seek(0, 2)
+    moov = _find_box(f, 0, end, b"moov")
+    if moov is None:
+        return None
+
+    for box, start, stop in _iter_boxes(f, *moov):
+        if box != b"trak":
+            continue
+        mdia = _find_box(f, start, stop, b"mdia")
+        if mdia is None:
+            continue
+        hdlr = _find_box(f, *mdia, b"hdlr")
+        if hdlr is None:
+            continue
+        f.seek(hdlr[0] + 8)  # version/flags, pre_defined
+        if f.read(4) != b"vide":
+            continue
+
+        mdhd = _find_box(f, *mdia, b"mdhd")
+        stts = _find_nested(f, mdia, (b"minf", b"stbl", b"stts"))
+        if mdhd is None or stts is None:
+            return None
+
+        f.seek(mdhd[0])
+        version = f.read(4)[0]
+        f.seek(16 if version == 1 else 8, 1)  # creation/modification times
+        (timescale,) = struct.unpack(">I", f.read(4))
+
+        f.seek(stts[0] + 4)
+        (count,) = struct.unpack(">I", f.read(4))
+        # never trust the entry count beyond what the box can actually hold
+        count = min(count, (stts[1] - stts[0] - 8) // 8)
+        entries = f.read(8 * count)
+        if len(entries) != 8 * count:
+            return None
+        samples = ticks = 0
+        for n, delta in struct.iter_unpack(">II", entries):
+            samples += n
+            ticks += n * delta
+        if not (samples and ticks and timescale):
+            return None
+        return samples * timescale / ticks
+
+    return None
+
+
+def _iter_boxes(f: BinaryIO, start: int, end: int) -> Iterator[tuple[bytes, int, int]]:
+    """(type, payload start, box end) for each box in [start, end)."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, box = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:  # 64-bit size follows the type
+            (size,) = struct.unpack(">Q", f.read(8))
+            header = 16
+        elif size == 0:  # box runs to the end of its parent
+            size = end - pos
+        if size < header:
+            return
+        yield box, pos + header, pos + size
+        pos += size
+
+
+def _find_box(f: BinaryIO, start: int, end: int, box: bytes) -> tuple[int, int] | None:
+    for kind, payload, stop in _iter_boxes(f, start, end):
+        if kind == box:
+            return payload, stop
+    return None
+
+
+def _find_nested(f: BinaryIO, parent: tuple[int, int], path: tuple[bytes, ...]) -> tuple[int, int] | None:
+    span: tuple[int, int] | None = parent
+    for box in path:
+        if span is None:
+            return None
+        span = _find_box(f, *span, box)
+    return span
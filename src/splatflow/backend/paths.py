@@ -1,11 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 from platformdirs import user_config_dir, user_data_dir
 
 
+def ensure_dir(path: Path) -> Path:
+    """Create ``path`` (and parents) unless it is already a directory.
+
+    A single stat on the common already-exists path, instead of mkdir failing
+    with EEXIST for every component.
+    """
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 @dataclass(frozen=True)
 class AppPaths:
     app_name: str = "SplatFlow"
@@ -13,29 +25,36 @@ class AppPaths:
     data_dir_override: str | None = None
     config_dir_override: str | None = None
 
-    @property
+    # cached_property stores into the instance __dict__, bypassing the frozen
+    # __setattr__, so the platformdirs lookups run once per instance.
+
+    @cached_property
     def data_dir(self) -> Path:
         if self.data_dir_override:
             return Path(self.data_dir_override)
         return Path(user_data_dir(self.app_name, self.app_author))
 
-    @property
+    @cached_property
     def config_dir(self) -> Path:
         if self.config_dir_override:
             return Path(self.config_dir_override)
         return Path(user_config_dir(self.app_name, self.app_author))
 
-    @property
+    @cached_property
     def tools_dir(self) -> Path:
         return self.data_dir / "tools"
 
-    @property
+    @cached_property
     def jobs_dir(self) -> Path:
         return self.data_dir / "jobs"
 
     def ensure(self) -> "AppPaths":
+        # Common case: everything exists already -> one stat per leaf directory.
+        if self.tools_dir.is_dir() and self.jobs_dir.is_dir() and self.config_dir.is_dir():
+            return self
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.tools_dir.mkdir(parents=True, exist_ok=True)
-        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        # children of data_dir: the parent walk is no longer needed
+        self.tools_dir.mkdir(exist_ok=True)
+        self.jobs_dir.mkdir(exist_ok=True)
         return self
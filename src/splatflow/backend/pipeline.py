@@ -1,17 +1,18 @@
 from __future__ import annotations
 
+import os
 import shutil
 from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Callable
 
-from .errors import ToolNotFoundError, ValidationError
+from .errors import ValidationError
 from .paths import AppPaths
 from .process import CommandRunner, RunOptions
 from .schema import PipelineConfig
 from .settings import SettingsStore
 from .toolchain import Toolchain
-from .workspace import Workspace, copy_images, iter_images
+from .workspace import Workspace, copy_images, iter_images, link_or_copy, link_tree
 from .tools.sharp_frames import SharpFramesArgs
 from .tools.colmap import (
     ColmapProject,
@@ -27,6 +28,13 @@ LogCallback = Callable[[str], None]
 StageCallback = Callable[[str], None]
 
 VIDEO_EXTS = {".mp4", ".mov", ".mkv", ".avi", ".m4v", ".webm"}
+# same set without the dots, matched against the raw file name by _ext_of
+_VIDEO_EXTS_BARE = frozenset(ext[1:] for ext in VIDEO_EXTS)
+
+
+def _ext_of(name: str) -> str:
+    dot = name.rfind(".")
+    return name[dot + 1 :].lower() if dot > 0 else ""
 
 
 @dataclass(frozen=True)
@@ -49,47 +57,52 @@ class SplatPipeline:
         on_stage: StageCallback | None = None,
     ) -> PipelineResult:
         config.validate()
+        # the runner outlives a run (the GUI keeps one); pick up environment changes
+        self.runner.refresh_env()
 
         workspace = Workspace.create(self.paths.jobs_dir, name="splatflow")
         log_path = workspace.logs_dir / "pipeline.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One handle for the whole run; line buffering keeps the file tail-able.
+        with open(log_path, "a", encoding="utf-8", buffering=1) as log_f:
 
-        def emit(line: str) -> None:
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(line + "\n")
-            if on_log:
-                on_log(line)
+            def emit(line: str) -> None:
+                log_f.write(line + "\n")
+                if on_log:
+                    on_log(line)
 
-        def stage(name: str) -> None:
-            emit(f"\n=== {name} ===")
-            if on_stage:
-                on_stage(name)
+            def stage(name: str) -> None:
+                emit(f"\n=== {name} ===")
+                if on_stage:
+                    on_stage(name)
 
-        settings = self.settings_store.load()
-        toolchain = Toolchain(paths=self.paths, settings=settings, runner=self.runner)
+            settings = self.settings_store.load()
+            toolchain = Toolchain(paths=self.paths, settings=settings, runner=self.runner)
 
-        output_root = Path(config.output.output_dir)
-        output_root.mkdir(parents=True, exist_ok=True)
-        output_dir = output_root / workspace.root.name
-        output_dir.mkdir(parents=True, exist_ok=True)
+            output_root = Path(config.output.output_dir)
+            output_root.mkdir(parents=True, exist_ok=True)
+            output_dir = output_root / workspace.root.name
+            output_dir.mkdir(parents=True, exist_ok=True)
 
-        # 1) ingest
-        stage("Ingest")
-        self._ingest(config, workspace, toolchain, emit)
+            # 1) ingest
+            stage("Ingest")
+            self._ingest(config, workspace, toolchain, emit)
 
-        # 2) colmap
-        stage("COLMAP")
-        self._run_colmap(config, workspace, toolchain, emit)
+            # 2) colmap
+            stage("COLMAP")
+            self._run_colmap(config, workspace, toolchain, emit)
 
-        # 2.5) export dataset artifacts
-        stage("Export")
-        self._export_artifacts(workspace, output_dir, emit)
+            # 2.5) export dataset artifacts
+            stage("Export")
+            self._export_artifacts(workspace, output_dir, emit)
 
-        # 3) lichtfeld
-        stage("LichtFeld Studio")
-        self._run_lichtfeld(config, workspace, toolchain, output_dir, emit)
+            # 3) lichtfeld
+            stage("LichtFeld Studio")
+            self._run_lichtfeld(config, workspace, toolchain, output_dir, emit)
+
+            emit("\nDone.")
 
-        emit("\nDone.")
         if not config.output.keep_intermediates:
             shutil.rmtree(workspace.root, ignore_errors=True)
 
@@ -97,11 +110,10 @@ class SplatPipeline:
 
 
     def _list_videos_in_dir(self, directory: Path) -> list[Path]:
-        videos: list[Path] = []
-        for p in sorted(directory.iterdir()):
-            if p.is_file() and p.suffix.lower() in VIDEO_EXTS:
-                videos.append(p)
-        return videos
+        with os.scandir(directory) as it:
+            videos = [e for e in it if _ext_of(e.name) in _VIDEO_EXTS_BARE and e.is_file()]
+        videos.sort(key=lambda e: e.name)
+        return [Path(e.path) for e in videos]
 
     def _ingest(
         self,
@@ -150,7 +162,7 @@ class SplatPipeline:
                 prefix = vid.stem
                 for j, img in enumerate(iter_images(out_dir)):
                     name = f"{prefix}_{i:03d}_{j:06d}{img.suffix.lower()}"
-                    shutil.copy2(img, workspace.images_dir / name)
+                    link_or_copy(img, workspace.images_dir / name)
             self._ensure_images(workspace, emit)
             return
 
@@ -167,8 +179,12 @@ class SplatPipeline:
             self.runner.run(cmd, options=RunOptions(env=env), on_line=emit)
             self._ensure_images(workspace, emit)
         else:
-            n = copy_images(src, workspace.images_dir)
-            emit(f"Copied {n} images to workspace.")
+            mode = config.input.import_mode
+            n = copy_images(src, workspace.images_dir, mode=mode)
+            if mode == "copy":
+                emit(f"Copied {n} images to workspace.")
+            else:
+                emit(f"Linked {n} images into workspace ({mode}).")
             self._ensure_images(workspace, emit)
 
 
@@ -186,6 +202,12 @@ class SplatPipeline:
         toolchain: Toolchain,
         emit: LogCallback,
     ) -> None:
+        # sanity: tool presence early (raises ToolNotFoundError before touching the workspace)
+        toolchain.colmap_exec()
+        # overlap the `-h` probes with each other instead of running them back to back
+        matcher = "sequential_matcher" if config.colmap.matcher == "sequential" else "exhaustive_matcher"
+        toolchain.prewarm_colmap_options(["feature_extractor", matcher])
+
         workspace.colmap_sparse.mkdir(parents=True, exist_ok=True)
         workspace.colmap_undistorted.mkdir(parents=True, exist_ok=True)
 
@@ -196,12 +218,6 @@ class SplatPipeline:
             undistorted_dir=workspace.colmap_undistorted,
         )
 
-        # sanity: tool presence early
-        try:
-            _ = toolchain.colmap_exec()
-        except ToolNotFoundError as e:
-            raise
-
         cmds = [
             feature_extractor_cmd(toolchain, proj, config.colmap),
             matcher_cmd(toolchain, proj, config.colmap),
@@ -228,8 +244,9 @@ class SplatPipeline:
             shutil.rmtree(dataset_dir, ignore_errors=True)
         dataset_dir.mkdir(parents=True, exist_ok=True)
 
-        shutil.copytree(workspace.images_dir, images_out, dirs_exist_ok=True)
-        shutil.copytree(workspace.colmap_dir, colmap_out, dirs_exist_ok=True)
+        # hardlinks: the dataset shares inodes with the workspace instead of doubling disk use
+        link_tree(workspace.images_dir, images_out)
+        link_tree(workspace.colmap_dir, colmap_out)
         emit(f"Exported images to: {images_out}")
         emit(f"Exported COLMAP data to: {colmap_out}")
 
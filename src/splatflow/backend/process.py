@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import os
 import shutil
 import subprocess
@@ -14,6 +15,8 @@ from .errors import CommandFailedError
 
 LineCallback = Callable[[str], None]
 
+_PIPE_BUFSIZE = 64 * 1024
+
 
 @dataclass(frozen=True)
 class RunOptions:
@@ -23,6 +26,23 @@ class RunOptions:
 
 
 class CommandRunner:
+    def __init__(self) -> None:
+        self._base_env: dict[str, str] = {}
+        self.refresh_env()
+
+    def refresh_env(self) -> None:
+        """Re-snapshot ``os.environ`` for the commands that follow.
+
+        The snapshot is taken once per pipeline run rather than per command;
+        per-call overrides are layered on top without copying os.environ again.
+        """
+        self._base_env = os.environ.copy()
+
+    def _env_for(self, options: RunOptions) -> dict[str, str]:
+        if not options.env:
+            return self._base_env
+        return {**self._base_env, **{k: str(v) for k, v in options.env.items()}}
+
     def which(self, exe: str) -> str | None:
         return shutil.which(exe)
 
@@ -34,39 +54,37 @@ class CommandRunner:
         on_line: LineCallback | None = None,
     ) -> None:
         options = options or RunOptions()
-        env = os.environ.copy()
-        if options.env:
-            env.update({k: str(v) for k, v in options.env.items()})
+        argv = list(map(str, command))
 
         tail = deque(maxlen=options.tail_lines)
         start = time.time()
 
         proc = subprocess.Popen(
-            list(map(str, command)),
+            argv,
             cwd=str(options.cwd) if options.cwd else None,
-            env=env,
+            env=self._env_for(options),
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
+            bufsize=_PIPE_BUFSIZE,
         )
 
         assert proc.stdout is not None
+        # Block reads from the pipe; line splitting and decoding happen in C.
+        stream = io.TextIOWrapper(proc.stdout, encoding="utf-8", errors="replace")
         try:
-            for line in proc.stdout:
+            for line in stream:
                 line = line.rstrip("\n")
                 tail.append(line)
                 if on_line:
                     on_line(line)
         finally:
-            proc.stdout.close()
+            stream.close()
 
         returncode = proc.wait()
         _ = time.time() - start
 
         if returncode != 0:
-            raise CommandFailedError(command=command, returncode=returncode, tail="\n".join(tail))
+            raise CommandFailedError(command=argv, returncode=returncode, tail="\n".join(tail))
 
     def run_capture(
         self,
@@ -75,14 +93,12 @@ class CommandRunner:
         options: RunOptions | None = None,
     ) -> str:
         options = options or RunOptions()
-        env = os.environ.copy()
-        if options.env:
-            env.update({k: str(v) for k, v in options.env.items()})
+        argv = list(map(str, command))
 
         proc = subprocess.run(
-            list(map(str, command)),
+            argv,
             cwd=str(options.cwd) if options.cwd else None,
-            env=env,
+            env=self._env_for(options),
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
@@ -91,5 +107,5 @@ class CommandRunner:
         out = proc.stdout or ""
         if proc.returncode != 0:
             tail = "\n".join(out.splitlines()[-options.tail_lines :])
-            raise CommandFailedError(command=command, returncode=proc.returncode, tail=tail)
+            raise CommandFailedError(command=argv, returncode=proc.returncode, tail=tail)
         return out
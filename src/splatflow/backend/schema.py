@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import dataclasses
+import os
+import stat
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
@@ -9,6 +10,7 @@ from .errors import ValidationError
 
 
 InputType = Literal["images", "video"]
+ImportMode = Literal["copy", "hardlink", "symlink"]
 SharpFramesSelection = Literal["best-n", "batched", "outlier-removal"]
 SharpFramesFormat = Literal["jpg", "png"]
 ColmapMatcher = Literal["exhaustive", "sequential"]
@@ -20,20 +22,33 @@ def _as_path(p: str | Path) -> Path:
     return p if isinstance(p, Path) else Path(p)
 
 
+def _stat_mode(p: Path) -> int | None:
+    """st_mode of ``p`` (following symlinks), or None if it can't be stat'ed."""
+    try:
+        return os.stat(p).st_mode
+    except (OSError, ValueError):  # ValueError: embedded NUL byte
+        return None
+
+
 @dataclass
 class InputConfig:
     type: InputType
     path: str
+    # how an images folder is brought into the workspace (ignored when sampling frames)
+    import_mode: ImportMode = "copy"
 
     def validate(self) -> None:
+        if self.import_mode not in ("copy", "hardlink", "symlink"):
+            raise ValidationError(f"Unknown image import mode: {self.import_mode}")
         p = _as_path(self.path)
+        mode = _stat_mode(p)
         if self.type == "images":
-            if not p.exists() or not p.is_dir():
+            if mode is None or not stat.S_ISDIR(mode):
                 raise ValidationError(f"Input images path must be a directory: {p}")
         else:
-            if not p.exists():
+            if mode is None:
                 raise ValidationError(f"Input video path does not exist: {p}")
-            if not (p.is_file() or p.is_dir()):
+            if not (stat.S_ISREG(mode) or stat.S_ISDIR(mode)):
                 raise ValidationError(f"Input video path must be a file or directory: {p}")
 
 
@@ -136,7 +151,8 @@ class OutputConfig:
 
     def validate(self) -> None:
         p = _as_path(self.output_dir)
-        if p.exists() and not p.is_dir():
+        mode = _stat_mode(p)
+        if mode is not None and not stat.S_ISDIR(mode):
             raise ValidationError(f"Output directory path exists and is not a directory: {p}")
 
 
@@ -156,7 +172,14 @@ class PipelineConfig:
         self.lichtfeld.validate()
 
     def to_dict(self) -> dict[str, Any]:
-        return dataclasses.asdict(self)
+        # All sections hold only primitives, so a shallow copy per section is enough.
+        return {
+            "input": vars(self.input).copy(),
+            "output": vars(self.output).copy(),
+            "frame_sampling": vars(self.frame_sampling).copy(),
+            "colmap": vars(self.colmap).copy(),
+            "lichtfeld": vars(self.lichtfeld).copy(),
+        }
 
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "PipelineConfig":
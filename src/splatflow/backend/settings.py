@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from .paths import AppPaths
 
+try:  # optional: faster (de)serialization
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 @dataclass
 class ToolPaths:
@@ -33,10 +38,19 @@ class Settings:
     tool_paths: ToolPaths = field(default_factory=ToolPaths)
     auto_install_tools: bool = True
     colmap: ColmapInstall = field(default_factory=ColmapInstall)
+    # GUI form state (widget name -> value), restored on the next launch
+    form: dict[str, Any] = field(default_factory=dict)
+    # fingerprint + output folder of the last successful run, to offer reuse
+    last_run: dict[str, str] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        data = asdict(self)
-        return data
+        return {
+            "tool_paths": vars(self.tool_paths).copy(),
+            "auto_install_tools": self.auto_install_tools,
+            "colmap": vars(self.colmap).copy(),
+            "form": dict(self.form),
+            "last_run": dict(self.last_run),
+        }
 
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "Settings":
@@ -46,6 +60,8 @@ class Settings:
             tool_paths=tool_paths,
             auto_install_tools=bool(data.get("auto_install_tools", True)),
             colmap=colmap,
+            form=dict(data.get("form") or {}),
+            last_run=dict(data.get("last_run") or {}),
         )
 
 
@@ -57,8 +73,14 @@ class SettingsStore:
     def load(self) -> Settings:
         if not self.path.exists():
             return Settings()
-        data = json.loads(self.path.read_text(encoding="utf-8"))
+        if orjson is not None:
+            data = orjson.loads(self.path.read_bytes())
+        else:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
         return Settings.from_dict(data)
 
     def save(self, settings: Settings) -> None:
-        self.path.write_text(json.dumps(settings.to_dict(), indent=2), encoding="utf-8")
+        if orjson is not None:
+            self.path.write_bytes(orjson.dumps(settings.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            self.path.write_text(json.dumps(settings.to_dict(), indent=2), encoding="utf-8")
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import atexit
+import json
 import os
 import platform
 import re
 import shutil
 import sys
+import threading
+import time
+from concurrent.futures import Future, as_completed, wait
 from dataclasses import dataclass
+from functools import cache, partial
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import Callable, Iterable, Mapping, Sequence, TypeVar
 
 import requests
 
-from .downloads import download_file, extract_tar_bz2_member, extract_zip, find_files
+from .downloads import (
+    download_and_extract_tar_bz2,
+    download_file,
+    extract_zip,
+    find_files,
+    find_member,
+)
 from .errors import ToolNotFoundError
-from .paths import AppPaths
+from .paths import AppPaths, ensure_dir
 from .process import CommandRunner, RunOptions
 from .settings import Settings
 
@@ -25,7 +37,92 @@ class ToolExec:
     env: dict[str, str]
 
 
-_COLMAP_OPT_RE = re.compile(r"^\s*--([A-Za-z0-9_.-]+)\b")
+T = TypeVar("T")
+
+_COLMAP_OPT_RE = re.compile(r"^\s*--([A-Za-z0-9_.-]+)\b", re.MULTILINE)
+# (colmap command, candidate table) -> resolved flags
+_FlagsKey = tuple[str, tuple[tuple[str, tuple[str, ...]], ...]]
+
+
+def _run_in_thread(fn: Callable[[], T], name: str) -> Future[T]:
+    """Run ``fn`` on a daemon thread (never blocks interpreter exit) and return its future."""
+    fut: Future[T] = Future()
+
+    def work() -> None:
+        try:
+            fut.set_result(fn())
+        except BaseException as e:
+            fut.set_exception(e)
+
+    threading.Thread(target=work, name=name, daemon=True).start()
+    return fut
+
+
+# Installs started in the background (the losing side of the COLMAP race) outlive
+# the Toolchain that started them, and the GUI builds a Toolchain per run. Keep
+# one in-flight future per install target so a second run joins it instead of
+# writing the same archive or conda prefix concurrently.
+_INSTALLS: dict[tuple[str, ...], Future] = {}
+_INSTALLS_LOCK = threading.Lock()
+
+
+def _shared_install(key: tuple[str, ...], fn: Callable[[], T], name: str) -> Future[T]:
+    with _INSTALLS_LOCK:
+        fut = _INSTALLS.get(key)
+        if fut is not None:
+            return fut
+        fut = _INSTALLS[key] = _run_in_thread(fn, name)
+    # outside the lock: runs inline if the install already finished
+    fut.add_done_callback(partial(_forget_install, key))
+    return fut
+
+
+def _forget_install(key: tuple[str, ...], fut: Future) -> None:
+    with _INSTALLS_LOCK:
+        if _INSTALLS.get(key) is fut:
+            del _INSTALLS[key]
+
+
+@atexit.register
+def _finish_installs() -> None:
+    # installs run on daemon threads; let them complete rather than be cut off
+    # mid-download or mid-`micromamba create` when the app exits
+    with _INSTALLS_LOCK:
+        pending = list(_INSTALLS.values())
+    wait(pending)
+
+
+@cache
+def _platform_tag() -> str:
+    sysname = platform.system().lower()
+    machine = platform.machine().lower()
+
+    if sysname.startswith("windows"):
+        return "win-64"
+    if sysname == "darwin":
+        return "osx-arm64" if machine in {"arm64", "aarch64"} else "osx-64"
+    if sysname == "linux":
+        return "linux-aarch64" if machine in {"arm64", "aarch64"} else "linux-64"
+
+    raise ToolNotFoundError(f"Unsupported platform for auto-install: {platform.system()} {platform.machine()}")
+
+
+@cache
+def _lichtfeld_keywords(platform_tag: str) -> tuple[str, ...]:
+    if platform_tag.startswith("win"):
+        return ("win", "windows", "portable", "x64", "64")
+    if platform_tag.startswith("linux"):
+        return ("linux", "ubuntu", "x64", "64")
+    if platform_tag.startswith("osx"):
+        return ("mac", "osx", "darwin", "arm64", "x64", "64")
+    return ()
+
+
+@cache
+def _lichtfeld_asset_re(platform_tag: str) -> re.Pattern[str]:
+    keywords = _lichtfeld_keywords(platform_tag)
+    # an empty alternation would match every asset; "(?!)" never matches
+    return re.compile("|".join(map(re.escape, keywords)) or "(?!)")
 
 
 class Toolchain:
@@ -35,27 +132,30 @@ class Toolchain:
         self.runner = runner
 
         self._colmap_options_cache: dict[str, frozenset[str]] = {}
-
-        (self.paths.tools_dir / "colmap").mkdir(parents=True, exist_ok=True)
-        (self.paths.tools_dir / "envs").mkdir(parents=True, exist_ok=True)
-        (self.paths.tools_dir / "micromamba").mkdir(parents=True, exist_ok=True)
-        (self.paths.tools_dir / "lichtfeld").mkdir(parents=True, exist_ok=True)
+        self._colmap_exec_cache: ToolExec | None = None
+        self._lichtfeld_exec_cache: ToolExec | None = None
+        self._sharp_frames_exec_cache: ToolExec | None = None
+        # parsed `colmap <cmd> -h` output persisted across runs, keyed by the COLMAP install
+        self._colmap_options_disk: tuple[str, dict[str, list[str]]] | None = None
+        self._colmap_options_pending: dict[str, Future[frozenset[str]]] = {}
+        self._colmap_flags_cache: dict[_FlagsKey, dict[str, str]] = {}
+        self._colmap_options_lock = threading.Lock()
+
+        for sub in ("colmap", "envs", "micromamba", "lichtfeld"):
+            ensure_dir(self.paths.tools_dir / sub)
 
     # -------------------------
     # Helpers
     # -------------------------
-    def _platform_tag(self) -> str:
-        sysname = platform.system().lower()
-        machine = platform.machine().lower()
-
-        if sysname.startswith("windows"):
-            return "win-64"
-        if sysname == "darwin":
-            return "osx-arm64" if machine in {"arm64", "aarch64"} else "osx-64"
-        if sysname == "linux":
-            return "linux-aarch64" if machine in {"arm64", "aarch64"} else "linux-64"
-
-        raise ToolNotFoundError(f"Unsupported platform for auto-install: {platform.system()} {platform.machine()}")
+    def invalidate_tool_cache(self) -> None:
+        """Forget resolved executables and parsed COLMAP options (e.g. after settings changed)."""
+        self._colmap_exec_cache = None
+        self._lichtfeld_exec_cache = None
+        self._sharp_frames_exec_cache = None
+        self._colmap_options_cache.clear()
+        self._colmap_options_pending.clear()
+        self._colmap_flags_cache.clear()
+        self._colmap_options_disk = None
 
     def _micromamba_member(self) -> str:
         # See micromamba docs: Windows tar contains Library/bin/micromamba.exe
@@ -90,13 +190,9 @@ class Toolchain:
                 "micromamba not found. Enable auto_install_tools or install micromamba and configure its path."
             )
 
-        tag = self._platform_tag()
+        tag = _platform_tag()
         url = f"https://micro.mamba.pm/api/micromamba/{tag}/latest"
-        archive = mm_dir / "micromamba.tar.bz2"
-        download_file(url, archive)
-
-        member = self._micromamba_member()
-        extract_tar_bz2_member(archive, member, exe)
+        download_and_extract_tar_bz2(url, exe, member=self._micromamba_member())
         return exe
 
     def ensure_env(self, name: str, packages: list[str]) -> Path:
@@ -111,14 +207,17 @@ class Toolchain:
             )
 
         micromamba = self.ensure_micromamba()
+        if env_prefix.exists():
+            # no marker: an earlier create was interrupted; don't build on top of it
+            shutil.rmtree(env_prefix, ignore_errors=True)
         root_prefix = self.paths.tools_dir / "mamba_root"
-        root_prefix.mkdir(parents=True, exist_ok=True)
+        ensure_dir(root_prefix)
 
         env = {"MAMBA_ROOT_PREFIX": str(root_prefix)}
         cmd = [str(micromamba), "create", "-y", "-p", str(env_prefix), "-c", "conda-forge", *packages]
         self.runner.run(cmd, options=RunOptions(env=env))
 
-        marker.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(marker.parent)
         marker.write_text("ok", encoding="utf-8")
         return env_prefix
 
@@ -126,17 +225,15 @@ class Toolchain:
     # COLMAP
     # -------------------------
     def _resolve_latest_colmap_release(self) -> str:
-        headers = {"User-Agent": "SplatFlow"}
-        r = requests.get(
+        final_url, _ = _cached_get(
             "https://github.com/colmap/colmap/releases/latest",
-            allow_redirects=True,
-            headers=headers,
-            timeout=30,
+            self.paths.tools_dir / "colmap" / "latest.json",
+            headers={"User-Agent": "SplatFlow"},
+            keep_body=False,  # an HTML page; only the redirect target matters
         )
-        r.raise_for_status()
         # typically ends in .../releases/tag/<version>
-        m = re.search(r"/tag/([^/]+)$", r.url)
-        tag = m.group(1) if m else r.url.rstrip("/").split("/")[-1]
+        m = re.search(r"/tag/([^/]+)$", final_url)
+        tag = m.group(1) if m else final_url.rstrip("/").split("/")[-1]
         return tag[1:] if tag.lower().startswith("v") else tag
 
     def ensure_colmap_official(self) -> Path:
@@ -151,41 +248,62 @@ class Toolchain:
                 "COLMAP not found. Enable auto_install_tools or configure the COLMAP path in settings."
             )
 
-        colmap_root = self.paths.tools_dir / "colmap"
-        version = (self.settings.colmap.version or "latest").strip()
-        if version.lower() == "latest":
-            version = self._resolve_latest_colmap_release()
-
-        build = (self.settings.colmap.build or "cuda").strip().lower()
-        if build not in {"cuda", "nocuda"}:
-            build = "cuda"
+        version, build, install_dir = self._colmap_official_target()
+        installed = self._installed_colmap_official(install_dir)
+        if installed is not None:
+            return installed
 
+        colmap_root = self.paths.tools_dir / "colmap"
         asset = f"colmap-x64-windows-{build}.zip"
-        install_dir = colmap_root / version / build
         marker = install_dir / ".installed"
 
-        if marker.exists():
-            existing = find_files(install_dir, ["COLMAP.bat", "colmap.bat"])
-            if existing:
-                return existing[0]
-            marker.unlink(missing_ok=True)
-
         url = f"https://github.com/colmap/colmap/releases/download/{version}/{asset}"
         archive = colmap_root / version / asset
         download_file(url, archive)
 
         if install_dir.exists():
             shutil.rmtree(install_dir)
-        extract_zip(archive, install_dir)
+        names = extract_zip(archive, install_dir)
 
-        candidates = find_files(install_dir, ["COLMAP.bat", "colmap.bat"])
-        if not candidates:
+        rel = find_member(names, ["COLMAP.bat"])
+        if rel is None:
             raise ToolNotFoundError("Downloaded COLMAP, but could not locate COLMAP.bat in the archive.")
 
-        marker.write_text("ok", encoding="utf-8")
-        return candidates[0]
+        _write_install_marker(marker, exe=rel)
+        return install_dir / rel
+
+    def _colmap_official_target(self) -> tuple[str, str, Path]:
+        """(version, build, install dir) of the configured official COLMAP release."""
+        version = (self.settings.colmap.version or "latest").strip()
+        if version.lower() == "latest":
+            version = self._resolve_latest_colmap_release()
+
+        build = (self.settings.colmap.build or "cuda").strip().lower()
+        if build not in {"cuda", "nocuda"}:
+            build = "cuda"
+
+        return version, build, self.paths.tools_dir / "colmap" / version / build
+
+    def _installed_colmap_official(self, install_dir: Path) -> Path | None:
+        marker = install_dir / ".installed"
+        if not marker.exists():
+            return None
+        recorded = _read_install_marker(marker, install_dir)
+        if recorded is not None:
+            return recorded
+        # markers written before the exe path was recorded
+        existing = find_files(install_dir, ["COLMAP.bat", "colmap.bat"])
+        if existing:
+            return existing[0]
+        marker.unlink(missing_ok=True)
+        return None
 
     def colmap_exec(self) -> ToolExec:
+        if self._colmap_exec_cache is None:
+            self._colmap_exec_cache = self._resolve_colmap_exec()
+        return self._colmap_exec_cache
+
+    def _resolve_colmap_exec(self) -> ToolExec:
         # 1) user-specified
         if self.settings.tool_paths.colmap:
             exe = Path(self.settings.tool_paths.colmap)
@@ -205,14 +323,55 @@ class Toolchain:
 
         # 3) official release (Windows)
         if self.settings.colmap.source == "official":
+            if os.name == "nt" and self.settings.auto_install_tools:
+                # only a cold start races; once installed the official build is always used
+                try:
+                    installed = self._installed_colmap_official(self._colmap_official_target()[2])
+                except requests.RequestException:
+                    installed = None  # release lookup failed; the conda side may still work
+                if installed is not None:
+                    return _colmap_bat_exec(installed)
+                return self._race_colmap_installs()
             try:
-                bat = self.ensure_colmap_official()
-                return ToolExec(exe=bat, prefix=["cmd.exe", "/d", "/s", "/c", str(bat)], env={})
+                return self._colmap_official_exec()
             except ToolNotFoundError:
                 if not self.settings.auto_install_tools:
                     raise
 
         # 4) conda-forge fallback
+        return self._colmap_conda_exec()
+
+    def _race_colmap_installs(self) -> ToolExec:
+        # Both sources are mostly network-bound; whichever is usable first wins.
+        # The other keeps running in the background, so the official build (which
+        # later runs pick up via its marker) is usually ready next time.
+        colmap = self.settings.colmap
+        tools = str(self.paths.tools_dir)
+        official = _shared_install(
+            ("colmap-official", tools, colmap.version or "latest", colmap.build or "cuda"),
+            self._colmap_official_exec,
+            "colmap-official",
+        )
+        conda = _shared_install(("env", tools, "colmap"), self._colmap_conda_exec, "colmap-conda")
+        errors: list[BaseException] = []
+        for fut in as_completed([official, conda]):
+            try:
+                result = fut.result()
+            except Exception as e:
+                errors.append(e)
+                continue
+            # if both made it, the official build wins regardless of finishing order
+            if fut is conda and official.done() and official.exception() is None:
+                return official.result()
+            return result
+        raise ToolNotFoundError(
+            "Could not install COLMAP: " + "; ".join(str(e) for e in errors)
+        ) from errors[-1]
+
+    def _colmap_official_exec(self) -> ToolExec:
+        return _colmap_bat_exec(self.ensure_colmap_official())
+
+    def _colmap_conda_exec(self) -> ToolExec:
         env_prefix = self.ensure_env("colmap", ["colmap"])
         micromamba = self.ensure_micromamba()
 
@@ -226,26 +385,118 @@ class Toolchain:
         cached = self._colmap_options_cache.get(colmap_command)
         if cached is not None:
             return cached
+        pending = self._colmap_options_pending.get(colmap_command)
+        if pending is not None:
+            return pending.result()
+        return self._load_colmap_options(colmap_command)
+
+    def colmap_flags(self, colmap_command: str, candidates: Mapping[str, Sequence[str]]) -> dict[str, str]:
+        """Map logical option names to the spelling this COLMAP build accepts.
+
+        ``candidates`` lists, per logical name, the option names to try in order of
+        preference; names this build doesn't know are left out. Resolved once per
+        command and candidate table.
+        """
+        key = (colmap_command, tuple((k, tuple(v)) for k, v in candidates.items()))
+        cached = self._colmap_flags_cache.get(key)
+        if cached is not None:
+            return cached
+        opts = self.colmap_options(colmap_command)
+        flags: dict[str, str] = {}
+        for logical, names in candidates.items():
+            for name in names:
+                if name in opts:
+                    flags[logical] = name
+                    break
+        self._colmap_flags_cache[key] = flags
+        return flags
+
+    def prewarm_colmap_options(self, commands: Iterable[str]) -> None:
+        """Parse ``colmap <cmd> -h`` for ``commands`` on background threads, one per command.
+
+        COLMAP is resolved in the calling thread so install errors surface there;
+        a later colmap_options() call only waits for its own command.
+        """
+        self.colmap_exec()
+        todo = [
+            c for c in dict.fromkeys(commands)
+            if c not in self._colmap_options_cache and c not in self._colmap_options_pending
+        ]
+        if not todo:
+            return
+        for c in todo:
+            self._colmap_options_pending[c] = _run_in_thread(
+                partial(self._load_colmap_options, c), f"colmap-options-{c}"
+            )
 
+    def _load_colmap_options(self, colmap_command: str) -> frozenset[str]:
         tool = self.colmap_exec()
+        with self._colmap_options_lock:
+            key, on_disk = self._colmap_options_store(tool)
+            stored = on_disk.get(colmap_command)
+        if stored is not None:
+            opts = frozenset(stored)
+            self._colmap_options_cache[colmap_command] = opts
+            return opts
+
         try:
             out = self.runner.run_capture(
                 [*tool.prefix, colmap_command, "-h"],
                 options=RunOptions(env=tool.env),
             )
         except Exception:
+            # not persisted: a failing help call may be transient
             opts: frozenset[str] = frozenset()
         else:
-            found: set[str] = set()
-            for line in out.splitlines():
-                m = _COLMAP_OPT_RE.match(line)
-                if m:
-                    found.add(m.group(1))
-            opts = frozenset(found)
+            opts = frozenset(_COLMAP_OPT_RE.findall(out))
+            with self._colmap_options_lock:
+                on_disk[colmap_command] = sorted(opts)
+                self._save_colmap_options(key, on_disk)
 
         self._colmap_options_cache[colmap_command] = opts
         return opts
 
+    def _colmap_options_path(self) -> Path:
+        return self.paths.tools_dir / "colmap" / "options.json"
+
+    def _colmap_identity(self, tool: ToolExec) -> str:
+        # Any path in the invocation that exists (exe, .bat, micromamba, env prefix)
+        # contributes its mtime, so reinstalling/upgrading COLMAP changes the key.
+        parts: list[str] = []
+        for arg in tool.prefix:
+            try:
+                st = os.stat(arg)
+            except OSError:
+                parts.append(arg)
+            else:
+                parts.append(f"{arg}@{st.st_mtime_ns}")
+        return "|".join(parts)
+
+    def _colmap_options_store(self, tool: ToolExec) -> tuple[str, dict[str, list[str]]]:
+        key = self._colmap_identity(tool)
+        if self._colmap_options_disk is not None and self._colmap_options_disk[0] == key:
+            return self._colmap_options_disk
+
+        commands: dict[str, list[str]] = {}
+        try:
+            data = json.loads(self._colmap_options_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict) and data.get("key") == key:
+            commands = dict(data.get("commands") or {})
+
+        self._colmap_options_disk = (key, commands)
+        return self._colmap_options_disk
+
+    def _save_colmap_options(self, key: str, commands: dict[str, list[str]]) -> None:
+        path = self._colmap_options_path()
+        tmp = path.with_suffix(".json.tmp")
+        try:
+            tmp.write_text(json.dumps({"key": key, "commands": commands}), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
     # -------------------------
     # Sharp Frames
     # -------------------------
@@ -259,6 +510,11 @@ class Toolchain:
         return self._with_path({}, self._env_bin_dirs(env_prefix))
 
     def sharp_frames_exe(self) -> ToolExec:
+        if self._sharp_frames_exec_cache is None:
+            self._sharp_frames_exec_cache = self._resolve_sharp_frames_exe()
+        return self._sharp_frames_exec_cache
+
+    def _resolve_sharp_frames_exe(self) -> ToolExec:
         env = self._ffmpeg_env()
 
         if getattr(sys, "frozen", False):
@@ -278,6 +534,11 @@ class Toolchain:
     # LichtFeld Studio
     # -------------------------
     def lichtfeld_exec(self) -> ToolExec:
+        if self._lichtfeld_exec_cache is None:
+            self._lichtfeld_exec_cache = self._resolve_lichtfeld_exec()
+        return self._lichtfeld_exec_cache
+
+    def _resolve_lichtfeld_exec(self) -> ToolExec:
         # 1) user-specified
         if self.settings.tool_paths.lichtfeld:
             exe = Path(self.settings.tool_paths.lichtfeld)
@@ -300,16 +561,15 @@ class Toolchain:
 
     def _download_lichtfeld(self) -> Path:
         tool_dir = self.paths.tools_dir / "lichtfeld"
-        tool_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(tool_dir)
 
-        platform_tag = self._platform_tag()
-        keywords = self._lichtfeld_keywords(platform_tag)
+        platform_tag = _platform_tag()
+        asset_re = _lichtfeld_asset_re(platform_tag)
 
         api = "https://api.github.com/repos/MrNeRF/LichtFeld-Studio/releases/latest"
         headers = {"Accept": "application/vnd.github+json", "User-Agent": "SplatFlow"}
-        r = requests.get(api, headers=headers, timeout=30)
-        r.raise_for_status()
-        data = r.json()
+        _, body = _cached_get(api, tool_dir / "latest.json", headers=headers)
+        data = json.loads(body)
 
         assets = data.get("assets") or []
         url = None
@@ -321,7 +581,7 @@ class Toolchain:
                 continue
             if not n.endswith(".zip"):
                 continue
-            if any(k in n for k in keywords):
+            if asset_re.search(n):
                 url = u
                 name = a.get("name") or "lichtfeld.zip"
                 break
@@ -332,34 +592,115 @@ class Toolchain:
                 "Install it manually and set its path in settings."
             )
 
-        archive = tool_dir / (name or "lichtfeld.zip")
+        asset = name or "lichtfeld.zip"
+        marker = tool_dir / ".installed"
+        recorded = _read_install_marker(marker, tool_dir, asset=asset)
+        if recorded is not None:
+            return recorded
+
+        archive = tool_dir / asset
         download_file(url, archive)
         extract_dir = tool_dir / "extracted"
-        if extract_dir.exists():
-            import shutil
-            shutil.rmtree(extract_dir)
-        extract_zip(archive, extract_dir)
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        names = extract_zip(archive, extract_dir)
 
-        inner = next((p for p in extract_dir.rglob("*.zip") if p.is_file()), None)
-        inner_dir = extract_dir / "inner"
+        exe_names = ["LichtFeld-Studio.exe", "LichtFeld-Studio"]
+        inner = next((n for n in names if n.lower().endswith(".zip")), None)
+        found: Path | None = None
         if inner:
-            if inner_dir.exists():
-                import shutil
-                shutil.rmtree(inner_dir)
-            extract_zip(inner, inner_dir)
-
-        for root in ([inner_dir, extract_dir] if inner else [extract_dir]):
-            candidates = find_files(root, ["LichtFeld-Studio.exe", "LichtFeld-Studio"])
-            if candidates:
-                return candidates[0]
+            inner_dir = extract_dir / "inner"
+            rel = find_member(extract_zip(extract_dir / inner, inner_dir), exe_names)
+            if rel is not None:
+                found = inner_dir / rel
+        if found is None:
+            rel = find_member(names, exe_names)
+            if rel is not None:
+                found = extract_dir / rel
+
+        if found is not None:
+            _write_install_marker(marker, exe=found.relative_to(tool_dir).as_posix(), asset=asset)
+            return found
 
         raise ToolNotFoundError("Downloaded LichtFeld Studio, but couldn't locate the executable.")
 
-    def _lichtfeld_keywords(self, platform_tag: str) -> list[str]:
-        if platform_tag.startswith("win"):
-            return ["win", "windows", "portable", "x64", "64"]
-        if platform_tag.startswith("linux"):
-            return ["linux", "ubuntu", "x64", "64"]
-        if platform_tag.startswith("osx"):
-            return ["mac", "osx", "darwin", "arm64", "x64", "64"]
-        return []
+
+def _colmap_bat_exec(bat: Path) -> ToolExec:
+    return ToolExec(exe=bat, prefix=["cmd.exe", "/d", "/s", "/c", str(bat)], env={})
+
+
+def _read_install_marker(marker: Path, base: Path, *, asset: str | None = None) -> Path | None:
+    """Executable recorded in an install marker, if it still exists (and matches ``asset``)."""
+    try:
+        data = json.loads(marker.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or not data.get("exe"):
+        return None
+    if asset is not None and data.get("asset") != asset:
+        return None
+    exe = base / data["exe"]
+    return exe if exe.is_file() else None
+
+
+def _write_install_marker(marker: Path, **data: str) -> None:
+    ensure_dir(marker.parent)
+    marker.write_text(json.dumps(data), encoding="utf-8")
+
+
+_RELEASE_TTL_S = 24 * 60 * 60
+
+
+def _cached_get(
+    url: str,
+    cache_path: Path,
+    *,
+    headers: Mapping[str, str],
+    ttl_s: float = _RELEASE_TTL_S,
+    keep_body: bool = True,
+) -> tuple[str, str]:
+    """GET ``url`` through a small on-disk cache; returns ``(final_url, body)``.
+
+    Within ``ttl_s`` of the last fetch the cached response is returned without
+    touching the network. After that the request is revalidated with the stored
+    ETag, and a stale copy is still used if GitHub is unreachable or rate-limited.
+    With ``keep_body=False`` only the final URL and ETag are stored, and cached
+    responses come back with an empty body.
+    """
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        age = time.time() - cache_path.stat().st_mtime
+    except (OSError, ValueError):
+        cached, age = None, None
+    if not isinstance(cached, dict) or not isinstance(cached.get("body"), str):
+        cached = None
+
+    if cached is not None and age is not None and 0 <= age < ttl_s:
+        return cached.get("url") or url, cached["body"]
+
+    req_headers = dict(headers)
+    if cached is not None and cached.get("etag"):
+        req_headers["If-None-Match"] = cached["etag"]
+
+    try:
+        r = requests.get(url, headers=req_headers, allow_redirects=True, timeout=30)
+        if r.status_code == 304 and cached is not None:
+            try:
+                os.utime(cache_path)  # restart the TTL
+            except OSError:
+                pass
+            return cached.get("url") or url, cached["body"]
+        r.raise_for_status()
+    except requests.RequestException:
+        if cached is None:
+            raise
+        return cached.get("url") or url, cached["body"]
+
+    entry = {"url": r.url, "etag": r.headers.get("ETag"), "body": r.text if keep_body else ""}
+    tmp = cache_path.with_suffix(".json.tmp")
+    try:
+        ensure_dir(cache_path.parent)
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+    return r.url, r.text
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Mapping
 
 from ..schema import ColmapConfig
 from ..toolchain import Toolchain
@@ -19,16 +20,32 @@ class ColmapProject:
         return self.sparse_dir / "0"
 
 
-def _pick_option(options: set[str] | frozenset[str], candidates: list[str]) -> str | None:
-    for c in candidates:
-        if c in options:
-            return c
-    return None
+# logical option -> candidate spellings, newest COLMAP naming first
+_FEATURE_EXTRACTOR_FLAGS = {
+    "use_gpu": ("FeatureExtraction.use_gpu", "SiftExtraction.use_gpu"),
+    "max_image_size": ("FeatureExtraction.max_image_size", "SiftExtraction.max_image_size"),
+    "num_threads": ("FeatureExtraction.num_threads", "SiftExtraction.num_threads"),
+    "max_num_features": ("SiftExtraction.max_num_features",),
+}
+_MATCHER_FLAGS = {
+    "use_gpu": ("FeatureMatching.use_gpu", "SiftMatching.use_gpu"),
+    "overlap": ("SequentialMatching.overlap",),
+}
+
+
+def _flag_args(flags: Mapping[str, str], values: Mapping[str, str]) -> list[str]:
+    """``--<option> <value>`` pairs for each logical flag this COLMAP build supports."""
+    args: list[str] = []
+    for logical, value in values.items():
+        opt = flags.get(logical)
+        if opt:
+            args.extend((f"--{opt}", value))
+    return args
 
 
 def feature_extractor_cmd(toolchain: Toolchain, proj: ColmapProject, cfg: ColmapConfig) -> tuple[list[str], dict[str, str]]:
     tool = toolchain.colmap_exec()
-    opts = toolchain.colmap_options("feature_extractor")
+    flags = toolchain.colmap_flags("feature_extractor", _FEATURE_EXTRACTOR_FLAGS)
     cmd = [
         *tool.prefix,
         "feature_extractor",
@@ -40,53 +57,35 @@ def feature_extractor_cmd(toolchain: Toolchain, proj: ColmapProject, cfg: Colmap
         cfg.camera_model,
         "--ImageReader.single_camera",
         "1" if cfg.single_camera else "0",
+        *_flag_args(
+            flags,
+            {
+                "use_gpu": "1" if cfg.use_gpu else "0",
+                "max_image_size": str(cfg.max_image_size),
+                "num_threads": str(cfg.num_threads),
+                "max_num_features": str(cfg.sift_max_num_features),
+            },
+        ),
     ]
-
-    gpu_opt = _pick_option(opts, ["FeatureExtraction.use_gpu", "SiftExtraction.use_gpu"])
-    if gpu_opt:
-        cmd += [f"--{gpu_opt}", "1" if cfg.use_gpu else "0"]
-
-    max_size_opt = _pick_option(opts, ["FeatureExtraction.max_image_size", "SiftExtraction.max_image_size"])
-    if max_size_opt:
-        cmd += [f"--{max_size_opt}", str(cfg.max_image_size)]
-
-    threads_opt = _pick_option(opts, ["FeatureExtraction.num_threads", "SiftExtraction.num_threads"])
-    if threads_opt:
-        cmd += [f"--{threads_opt}", str(cfg.num_threads)]
-
-    if "SiftExtraction.max_num_features" in opts:
-        cmd += ["--SiftExtraction.max_num_features", str(cfg.sift_max_num_features)]
-
     return cmd, tool.env
 
 
 def matcher_cmd(toolchain: Toolchain, proj: ColmapProject, cfg: ColmapConfig) -> tuple[list[str], dict[str, str]]:
     tool = toolchain.colmap_exec()
+    values = {"use_gpu": "1" if cfg.use_gpu else "0"}
     if cfg.matcher == "sequential":
-        opts = toolchain.colmap_options("sequential_matcher")
-        gpu_opt = _pick_option(opts, ["FeatureMatching.use_gpu", "SiftMatching.use_gpu"])
-        overlap_opt = "SequentialMatching.overlap" if "SequentialMatching.overlap" in opts else None
-        cmd = [
-            *tool.prefix,
-            "sequential_matcher",
-            "--database_path",
-            str(proj.database_path),
-        ]
-        if gpu_opt:
-            cmd += [f"--{gpu_opt}", "1" if cfg.use_gpu else "0"]
-        if overlap_opt:
-            cmd += [f"--{overlap_opt}", str(cfg.sequential_overlap)]
+        command = "sequential_matcher"
+        values["overlap"] = str(cfg.sequential_overlap)
     else:
-        opts = toolchain.colmap_options("exhaustive_matcher")
-        gpu_opt = _pick_option(opts, ["FeatureMatching.use_gpu", "SiftMatching.use_gpu"])
-        cmd = [
-            *tool.prefix,
-            "exhaustive_matcher",
-            "--database_path",
-            str(proj.database_path),
-        ]
-        if gpu_opt:
-            cmd += [f"--{gpu_opt}", "1" if cfg.use_gpu else "0"]
+        command = "exhaustive_matcher"
+    flags = toolchain.colmap_flags(command, _MATCHER_FLAGS)
+    cmd = [
+        *tool.prefix,
+        command,
+        "--database_path",
+        str(proj.database_path),
+        *_flag_args(flags, values),
+    ]
     return cmd, tool.env
 
 
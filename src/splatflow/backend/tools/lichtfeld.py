@@ -35,18 +35,15 @@ class LichtfeldTrainArgs:
             "--no-splash",
         ]
 
-        if cfg.gut:
-            cmd.append("--gut")
-        if cfg.ppisp_controller:
-            cmd.append("--ppisp-controller")
-        if cfg.mip_filter:
-            cmd.append("--enable-mip")
-        if cfg.headless:
-            cmd.append("--headless")
-        if cfg.eval:
-            cmd.append("--eval")
-        if cfg.save_eval_images:
-            cmd.append("--save-eval-images")
+        switches = (
+            (cfg.gut, "--gut"),
+            (cfg.ppisp_controller, "--ppisp-controller"),
+            (cfg.mip_filter, "--enable-mip"),
+            (cfg.headless, "--headless"),
+            (cfg.eval, "--eval"),
+            (cfg.save_eval_images, "--save-eval-images"),
+        )
+        cmd.extend(flag for enabled, flag in switches if enabled)
         if cfg.test_every:
-            cmd += ["--test-every", str(cfg.test_every)]
+            cmd.extend(("--test-every", str(cfg.test_every)))
         return cmd, tool.env
@@ -1,68 +1,162 @@
 from __future__ import annotations
 
+import os
 import shutil
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
-IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp"}
+from .paths import ensure_dir
+from .schema import ImportMode
+
+IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp"})
+
+_COPY_WORKERS = 8
+_FICLONE = 0x40049409  # linux/fs.h: share extents (btrfs, XFS with reflink, bcachefs)
 
 
 @dataclass(frozen=True)
 class Workspace:
     root: Path
 
-    @property
+    @cached_property
     def images_dir(self) -> Path:
         return self.root / "images"
 
-    @property
+    @cached_property
     def colmap_dir(self) -> Path:
         return self.root / "colmap"
 
-    @property
+    @cached_property
     def colmap_db(self) -> Path:
         return self.colmap_dir / "database.db"
 
-    @property
+    @cached_property
     def colmap_sparse(self) -> Path:
         return self.colmap_dir / "sparse"
 
-    @property
+    @cached_property
     def colmap_undistorted(self) -> Path:
         return self.colmap_dir / "undistorted"
 
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         return self.root / "logs"
 
     def ensure(self) -> "Workspace":
-        self.root.mkdir(parents=True, exist_ok=True)
-        self.images_dir.mkdir(parents=True, exist_ok=True)
-        self.colmap_dir.mkdir(parents=True, exist_ok=True)
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        # root is created by its children
+        ensure_dir(self.images_dir)
+        ensure_dir(self.colmap_dir)
+        ensure_dir(self.logs_dir)
         return self
 
     @staticmethod
     def create(jobs_dir: Path, name: str | None = None) -> "Workspace":
-        jobs_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(jobs_dir)
         safe = (name or "job").strip().replace(" ", "_")
         ts = time.strftime("%Y%m%d-%H%M%S")
-        root = jobs_dir / f"{safe}-{ts}"
+        # random suffix: jobs started within the same second must not share a root
+        root = jobs_dir / f"{safe}-{ts}-{os.urandom(3).hex()}"
         return Workspace(root=root).ensure()
 
 
 def iter_images(directory: Path) -> Iterable[Path]:
-    for p in sorted(directory.iterdir()):
-        if p.is_file() and p.suffix.lower() in IMAGE_EXTS:
-            yield p
-
-
-def copy_images(src_dir: Path, dst_dir: Path) -> int:
-    dst_dir.mkdir(parents=True, exist_ok=True)
+    with os.scandir(directory) as it:
+        entries = [e for e in it if os.path.splitext(e.name)[1].lower() in IMAGE_EXTS and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    for e in entries:
+        yield Path(e.path)
+
+
+def copy_images(src_dir: Path, dst_dir: Path, mode: ImportMode = "copy") -> int:
+    """Place the images of ``src_dir`` into ``dst_dir``.
+
+    ``hardlink``/``symlink`` avoid duplicating the data; COLMAP only reads the
+    pixels, so sharing the originals is safe. Both fall back to a copy when the
+    link cannot be created (other filesystem, no symlink privilege on Windows).
+    """
+    ensure_dir(dst_dir)
+    place: Callable[[Path, Path], None] = _PLACERS[mode]
+    images = list(iter_images(src_dir))
+    if len(images) < 2:
+        for img in images:
+            place(img, dst_dir / img.name)
+        return len(images)
+    # I/O bound; copies release the GIL in sendfile/ioctl
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as ex:
+        for _ in ex.map(lambda img: place(img, dst_dir / img.name), images):
+            pass
+    return len(images)
+
+
+def _hardlink_or_copy(src: Path, dst: Path) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        _clone_or_copy(src, dst)
+
+
+def _symlink_or_copy(src: Path, dst: Path) -> None:
+    try:
+        os.symlink(src.resolve(), dst)
+    except OSError:
+        _clone_or_copy(src, dst)
+
+
+def _clone_or_copy(src: Path, dst: Path) -> None:
+    if sys.platform.startswith("linux") and _reflink(src, dst):
+        shutil.copystat(src, dst)
+        return
+    shutil.copy2(src, dst)
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    import fcntl
+
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        return True
+    except OSError:
+        return False
+
+
+def link_tree(src_dir: Path, dst_dir: Path) -> int:
+    """Mirror ``src_dir`` into ``dst_dir`` using hardlinks where possible.
+
+    Falls back to a regular copy per file (e.g. across filesystems). Symlinked
+    files (the "symlink" import mode) are resolved, so the mirror holds the
+    image data rather than links back into the user's folder.
+    Returns the number of files placed.
+    """
+    ensure_dir(dst_dir)
     count = 0
-    for img in iter_images(src_dir):
-        shutil.copy2(img, dst_dir / img.name)
-        count += 1
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            target = dst_dir / entry.name
+            if entry.is_dir(follow_symlinks=False):
+                count += link_tree(Path(entry.path), target)
+            elif entry.is_file():
+                src = os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+                link_or_copy(src, target)
+                count += 1
     return count
+
+
+def link_or_copy(src: str | os.PathLike[str], dst: Path) -> None:
+    """Hardlink ``src`` to ``dst``; copy the bytes (sendfile on Linux) if linking fails."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+_PLACERS: dict[str, Callable[[Path, Path], None]] = {
+    "copy": _clone_or_copy,
+    "hardlink": _hardlink_or_copy,
+    "symlink": _symlink_or_copy,
+}
@@ -1,94 +1,305 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import sys
+import threading
 import time
-from dataclasses import asdict
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 import shutil
 import subprocess
 from fractions import Fraction
+from functools import cache
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from splatflow.backend import PipelineConfig, SplatPipeline
+from splatflow.backend.media import MP4_EXTS, mp4_video_fps
 from splatflow.backend.paths import AppPaths
 from splatflow.backend.settings import Settings, SettingsStore, ToolPaths
 
-VIDEO_EXTS = {".mp4", ".mov", ".mkv", ".avi", ".m4v", ".webm"}
-
-def _forward_wheel_to_scrollarea(src: QtWidgets.QWidget, event: QtGui.QWheelEvent) -> None:
-    # Find nearest parent scroll area (your options panel is inside one)
-    w: QtWidgets.QWidget | None = src.parentWidget()
-    scroll: QtWidgets.QAbstractScrollArea | None = None
-    while w is not None:
-        if isinstance(w, QtWidgets.QAbstractScrollArea):
-            scroll = w
-            break
-        w = w.parentWidget()
-
-    if scroll is not None:
-        bar = scroll.verticalScrollBar()
-        pixel = event.pixelDelta()
-        if not pixel.isNull():
-            bar.setValue(bar.value() - pixel.y())
-        else:
-            steps = event.angleDelta().y() / 120.0
-            bar.setValue(bar.value() - int(steps * bar.singleStep() * 3))
+VIDEO_EXTS = frozenset({".mp4", ".mov", ".mkv", ".avi", ".m4v", ".webm"})
 
-    # Always consume so spinbox never sees it as "step value"
-    event.accept()
+_FPS_CACHE_MAX = 64
+_MAX_PENDING_EVENTS = 2000
 
+_MAIN_QSS = "QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QPushButton { min-height: 28px; }"
 
-class NoWheelSpinBox(QtWidgets.QSpinBox):
+# QSizePolicy is a plain value type: safe to build before QApplication exists
+_FIXED_POLICY = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+
+# The NoWheel* widgets ignore wheel events; Qt propagates them up to the options
+# panel's scroll area, which does the scrolling. No per-widget event filters.
+class SplatScrollArea(QtWidgets.QScrollArea):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        le = self.lineEdit()
-        if le is not None:
-            le.installEventFilter(self)
+        # the bar is never replaced, so look it up once
+        self._bar = self.verticalScrollBar()
+        # scroll distance per 120-unit wheel notch (three lines, as Qt does)
+        self._step_px = self._bar.singleStep() * 3
+        # wheel deltas that arrive within one event-loop pass are applied as a
+        # single setValue (touchpads emit many small pixelDelta events)
+        self._pending_scroll_delta = 0
+        self._scroll_timer = QtCore.QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(0)
+        self._scroll_timer.timeout.connect(self._apply_scroll)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._step_px = self._bar.singleStep() * 3
 
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
-        _forward_wheel_to_scrollarea(self, event)
+        delta = event.pixelDelta().y() or int(event.angleDelta().y() * self._step_px / 120)
+        if not delta:
+            # horizontal wheel / sideways swipe: let QScrollArea move the x bar
+            super().wheelEvent(event)
+            return
+        self._pending_scroll_delta += delta
+        if not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+        event.accept()
+
+    def _apply_scroll(self) -> None:
+        delta, self._pending_scroll_delta = self._pending_scroll_delta, 0
+        if delta:
+            self._bar.setValue(self._bar.value() - delta)
+
+
+# Unfocused spin boxes/combos pass the wheel on to the scroll area; once the user
+# has clicked or tabbed into one, the wheel steps its value as usual.
+class NoWheelSpinBox(QtWidgets.QSpinBox):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.setFocusPolicy(QtCore.Qt.StrongFocus)
 
-    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        if event.type() == QtCore.QEvent.Type.Wheel:
-            _forward_wheel_to_scrollarea(self, event)  # type: ignore[arg-type]
-            return True
-        return super().eventFilter(obj, event)
+    def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
+        if not self.hasFocus():
+            event.ignore()
+            return
+        super().wheelEvent(event)
 
 
 class NoWheelComboBox(QtWidgets.QComboBox):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.installEventFilter(self)
+        self.setFocusPolicy(QtCore.Qt.StrongFocus)
 
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
-        _forward_wheel_to_scrollarea(self, event)
+        if not self.hasFocus():
+            event.ignore()
+            return
+        super().wheelEvent(event)
+
+
+def _widget_value(w: QtWidgets.QWidget) -> object:
+    if isinstance(w, QtWidgets.QAbstractButton):
+        return w.isChecked()
+    if isinstance(w, QtWidgets.QComboBox):
+        return w.currentText()
+    if isinstance(w, QtWidgets.QLineEdit):
+        return w.text()
+    return int(w.value())  # type: ignore[attr-defined]
+
+
+def _set_widget_value(w: QtWidgets.QWidget, value: object) -> None:
+    if isinstance(w, QtWidgets.QAbstractButton):
+        w.setChecked(bool(value))
+    elif isinstance(w, QtWidgets.QComboBox):
+        idx = w.findText(str(value))
+        if idx >= 0:
+            w.setCurrentIndex(idx)
+    elif isinstance(w, QtWidgets.QLineEdit):
+        w.setText(str(value))
+    else:
+        w.setValue(int(value))  # type: ignore[attr-defined]
+
+
+def _config_key(cfg: PipelineConfig) -> str:
+    return hashlib.sha256(json.dumps(cfg.to_dict(), sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@cache
+def _ffprobe_path() -> str | None:
+    # resolved once per process; PATH lookups stat every candidate directory
+    return shutil.which("ffprobe")
+
+
+def _probe_fps_ffprobe(video: Path) -> float | None:
+    ffprobe = _ffprobe_path()
+    if ffprobe is None:
+        return None
+    cmd = [
+        ffprobe,
+        "-v",
+        "error",
+        # the stream header is enough for avg_frame_rate; don't scan megabytes
+        "-analyzeduration",
+        "100000",
+        "-probesize",
+        "100000",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "stream=avg_frame_rate",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        str(video),
+    ]
+    try:
+        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=10).strip()
+    except Exception:
+        return None
+    if not out or out == "0/0":
+        return None
+    try:
+        fps = float(Fraction(out)) if "/" in out else float(out)
+    except Exception:
+        return None
+    return fps if fps > 0 else None
+
+
+@cache
+def _cv2():
+    # optional; import attempted once per process, a failure is remembered too
+    try:
+        import cv2  # type: ignore
+    except Exception:
+        return None
+    return cv2
+
+
+def _probe_fps_cv2(video: Path) -> float | None:
+    cv2 = _cv2()
+    if cv2 is None:
+        return None
+    # ask for the FFmpeg backend directly instead of letting OpenCV try each
+    # registered backend in turn; builds without it fall back to the default
+    cap = cv2.VideoCapture(str(video), cv2.CAP_FFMPEG)
+    if not cap.isOpened():
+        cap.release()
+        cap = cv2.VideoCapture(str(video))
+    try:
+        if not cap.isOpened():
+            return None
+        fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
+        return fps if fps > 0 else None
+    finally:
+        cap.release()
+
+
+# MP4/MOV carry the frame rate in their box tree; no need to spawn ffprobe
+_MP4_FPS_PROBERS = (mp4_video_fps, _probe_fps_ffprobe, _probe_fps_cv2)
+_FPS_PROBERS = (_probe_fps_ffprobe, _probe_fps_cv2)
+
+
+def _probe_video_fps(video: Path) -> float | None:
+    probers = _MP4_FPS_PROBERS if video.suffix.lower() in MP4_EXTS else _FPS_PROBERS
+    for probe in probers:
+        fps = probe(video)
+        if fps:
+            return fps
+    return None
+
+
+def _video_key(video: Path) -> tuple[str, int, int] | None:
+    try:
+        st = video.stat()
+    except OSError:
+        return None
+    return (str(video), st.st_mtime_ns, st.st_size)
+
+
+def _load_fps_cache(path: Path) -> dict[tuple[str, int, int], float | None]:
+    try:
+        rows = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    cache: dict[tuple[str, int, int], float | None] = {}
+    for row in rows if isinstance(rows, list) else []:
+        try:
+            video, mtime_ns, size, fps = row
+            cache[(str(video), int(mtime_ns), int(size))] = float(fps) if fps else None
+        except (TypeError, ValueError):
+            continue
+    return dict(list(cache.items())[-_FPS_CACHE_MAX:])
+
+
+def _save_fps_cache(path: Path, cache: dict[tuple[str, int, int], float | None]) -> None:
+    tmp = path.with_suffix(".json.tmp")
+    try:
+        tmp.write_text(json.dumps([[*key, fps] for key, fps in cache.items()]), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+class _FpsProbeSignals(QtCore.QObject):
+    probed = QtCore.Signal(object, object)  # (video key, fps or None)
+
+
+# ffprobe can take seconds on slow or network storage, so it runs on the global
+# thread pool and reports back to the GUI thread through a queued signal.
+class FpsProbeRunnable(QtCore.QRunnable):
+    def __init__(self, video: Path, key: tuple[str, int, int]) -> None:
+        super().__init__()
+        self.video = video
+        self.key = key
+        self.signals = _FpsProbeSignals()
+
+    def run(self) -> None:
+        # always report back: the window only forgets an in-flight probe on this signal
+        try:
+            fps = _probe_video_fps(self.video)
+        except Exception:
+            fps = None
+        self.signals.probed.emit(self.key, fps)
 
-    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        if event.type() == QtCore.QEvent.Type.Wheel:
-            _forward_wheel_to_scrollarea(self, event)  # type: ignore[arg-type]
-            return True
-        return super().eventFilter(obj, event)
 
 class PipelineWorker(QtCore.QObject):
-    log_line = QtCore.Signal(str)
-    stage = QtCore.Signal(str)
+    # One instance per window, connected once; each Start calls run() on a fresh
+    # thread. Log lines and stage changes are queued here and the UI drains them
+    # in one go; only the first event after a drain posts a signal to the GUI thread.
+    events_ready = QtCore.Signal()
     finished = QtCore.Signal(object)
     failed = QtCore.Signal(str)
 
-    def __init__(self, config: PipelineConfig) -> None:
+    def __init__(self) -> None:
         super().__init__()
-        self.config = config
-
-    @QtCore.Slot()
-    def run(self) -> None:
+        self._events: list[tuple[str, str]] = []
+        self._events_lock = threading.Lock()
+        self._dropped = 0
+
+    def _post(self, kind: str, text: str) -> None:
+        with self._events_lock:
+            # if the GUI falls behind, shed log lines (never stage changes) so the
+            # backlog and the UI's catch-up time stay bounded
+            if kind == "log" and len(self._events) >= _MAX_PENDING_EVENTS:
+                self._dropped += 1
+                return
+            self._events.append((kind, text))
+            notify = len(self._events) == 1
+        if notify:
+            self.events_ready.emit()
+
+    def take_events(self) -> list[tuple[str, str]]:
+        with self._events_lock:
+            events, self._events = self._events, []
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            events.append(("log", f"[{dropped} log lines skipped here; the job's logs/pipeline.log has them all]"))
+        return events
+
+    def run(self, config: PipelineConfig, pipeline: SplatPipeline) -> None:
         try:
-            pipe = SplatPipeline()
-            res = pipe.run(
-                self.config,
-                on_log=self.log_line.emit,
-                on_stage=self.stage.emit,
+            res = pipeline.run(
+                config,
+                on_log=lambda line: self._post("log", line),
+                on_stage=lambda stage: self._post("stage", stage),
             )
             self.finished.emit(res)
         except Exception as e:
@@ -96,18 +307,111 @@ class PipelineWorker(QtCore.QObject):
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    # (config section, field, widget attribute); see _widget_value for the read
+    _CONFIG_MAP: tuple[tuple[str, str, str], ...] = (
+        ("frame_sampling", "enabled", "sf_enabled"),
+        ("frame_sampling", "selection_method", "sf_method"),
+        ("frame_sampling", "num_frames", "sf_num_frames"),
+        ("frame_sampling", "fps", "sf_fps"),
+        ("frame_sampling", "width", "sf_width"),
+        ("frame_sampling", "format", "sf_format"),
+
+        ("frame_sampling", "min_buffer", "sf_min_buffer"),
+        ("frame_sampling", "batch_size", "sf_batch_size"),
+        ("frame_sampling", "batch_buffer", "sf_batch_buffer"),
+        ("frame_sampling", "outlier_window_size", "sf_outlier_window"),
+        ("frame_sampling", "outlier_sensitivity", "sf_outlier_sens"),
+
+        ("colmap", "matcher", "colmap_matcher"),
+        ("colmap", "use_gpu", "colmap_gpu"),
+        ("colmap", "max_image_size", "colmap_max_img"),
+        ("colmap", "camera_model", "colmap_camera_model"),
+        ("colmap", "single_camera", "colmap_single_cam"),
+
+        ("colmap", "sift_max_num_features", "colmap_sift_features"),
+        ("colmap", "sequential_overlap", "colmap_seq_overlap"),
+
+        ("lichtfeld", "iterations", "lfs_iters"),
+        ("lichtfeld", "max_cap", "lfs_max_cap"),
+        ("lichtfeld", "strategy", "lfs_strategy"),
+        ("lichtfeld", "resize_factor", "lfs_resize"),
+
+        ("lichtfeld", "eval", "lfs_eval"),
+        ("lichtfeld", "save_eval_images", "lfs_save_eval"),
+        ("lichtfeld", "test_every", "lfs_test_every"),
+
+        ("lichtfeld", "gut", "lfs_gut"),
+        ("lichtfeld", "ppisp_controller", "lfs_ppisp"),
+        ("lichtfeld", "mip_filter", "lfs_mip"),
+
+        ("output", "keep_intermediates", "keep_intermediates"),
+    )
+    # widgets whose values are persisted in Settings.form between launches
+    _FORM_WIDGETS: tuple[str, ...] = (
+        "input_type",
+        "input_path",
+        "output_dir",
+        *(widget for _, _, widget in _CONFIG_MAP),
+        "export_run_log",
+    )
+    # the subset built by _ensure_advanced
+    _ADVANCED_WIDGETS: tuple[str, ...] = (
+        "sf_width",
+        "sf_format",
+        "colmap_camera_model",
+        "colmap_single_cam",
+        "colmap_sift_features",
+        "colmap_seq_overlap",
+        "lfs_resize",
+        "lfs_gut",
+        "lfs_ppisp",
+        "lfs_mip",
+        "lfs_eval",
+        "lfs_save_eval",
+        "lfs_test_every",
+        "keep_intermediates",
+        "export_run_log",
+    )
+
     def __init__(self) -> None:
         super().__init__()
+        # nothing is shown yet; hold off repaints until every row is in place
+        self.setUpdatesEnabled(False)
+        try:
+            self._build()
+        finally:
+            # re-enabled even if building fails, or the window would never repaint
+            self.setUpdatesEnabled(True)
+        # not needed for the first paint; runs on the first event-loop pass
+        QtCore.QTimer.singleShot(0, self._late_init)
+
+    def _build(self) -> None:
         self.setWindowTitle("SplatFlow")
         self.setMinimumSize(980, 640)
-        self.setStyleSheet(
-            "QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox, QPushButton { min-height: 28px; }"
-        )
+        self.setStyleSheet(_MAIN_QSS)
         self.paths = AppPaths().ensure()
         self.settings_store = SettingsStore(self.paths)
 
-        self._thread: QtCore.QThread | None = None
-        self._worker: PipelineWorker | None = None
+        self._thread: threading.Thread | None = None
+        # Its signals always cross from the pipeline thread into the GUI thread,
+        # so they are connected as queued up front rather than auto-detected per emit.
+        self._worker = PipelineWorker()
+        queued = QtCore.Qt.QueuedConnection
+        self._worker.events_ready.connect(self._drain_worker_events, queued)
+        self._worker.finished.connect(self._on_finished, queued)
+        self._worker.failed.connect(self._on_failed, queued)
+        # created on the first Start and reused; runs never overlap (Start is
+        # disabled while one is in flight)
+        self._pipeline: SplatPipeline | None = None
+        # explicit start directory for file dialogs, so Qt doesn't have to ask
+        # the platform (xdg portal on Linux) for one each time
+        self._last_browse_dir = str(Path.home())
+        # probed FPS per (path, mtime_ns, size); a changed file gets a new key.
+        # Persisted so videos seen in earlier sessions are never re-probed.
+        self._fps_cache_path = self.paths.data_dir / "fps_cache.json"
+        self._fps_cache: dict[tuple[str, int, int], float | None] = _load_fps_cache(self._fps_cache_path)
+        self._fps_probes: dict[tuple[str, int, int], FpsProbeRunnable] = {}
+        self._fps_wanted: tuple[str, int, int] | None = None
 
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
@@ -118,7 +422,7 @@ class MainWindow(QtWidgets.QMainWindow):
         form_container.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
         form_col = QtWidgets.QVBoxLayout(form_container)
 
-        scroll = QtWidgets.QScrollArea()
+        scroll = SplatScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setWidget(form_container)
         scroll.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
@@ -127,10 +431,20 @@ class MainWindow(QtWidgets.QMainWindow):
         self.log = QtWidgets.QPlainTextEdit()
         self.log.setReadOnly(True)
         self.log.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
-        fixed = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
-        self.log.setFont(fixed)
+        # keeps QPlainTextEdit layout cheap on chatty runs; the full text is kept
+        # in _run_log for the exported log
+        self.log.setMaximumBlockCount(20000)
         layout.addWidget(self.log, 2)
 
+        # _append buffers lines and a short single-shot timer writes them to the
+        # widget in one appendPlainText call
+        self._log_buffer: list[str] = []
+        self._run_log: list[str] = []
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
         # Input
         input_box = QtWidgets.QGroupBox("Input")
         form_col.addWidget(input_box)
@@ -142,25 +456,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self.input_type.addItems(["images", "video"])
         input_layout.addRow("Type", self.input_type)
 
-        self.input_path = QtWidgets.QLineEdit()
-        self.input_path.editingFinished.connect(self._apply_video_fps_from_input)
-        browse_in = QtWidgets.QPushButton("Browse…")
-        browse_in.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        browse_in.clicked.connect(self._browse_input)
-        browse_in.clicked.connect(self._apply_video_fps_from_input)
-        in_row = QtWidgets.QHBoxLayout()
-        in_row.addWidget(self.input_path, 1)
-        in_row.addWidget(browse_in)
-        input_layout.addRow("Path", in_row)
-
-        self.output_dir = QtWidgets.QLineEdit()
-        browse_out = QtWidgets.QPushButton("Browse…")
-        browse_out.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        browse_out.clicked.connect(self._browse_output)
-        out_row = QtWidgets.QHBoxLayout()
-        out_row.addWidget(self.output_dir, 1)
-        out_row.addWidget(browse_out)
-        input_layout.addRow("Output folder", out_row)
+        # FPS probing is debounced: bursts of edits/browses settle into one probe
+        self._fps_debounce = QtCore.QTimer(self)
+        self._fps_debounce.setSingleShot(True)
+        self._fps_debounce.setInterval(250)
+        self._fps_debounce.timeout.connect(self._apply_video_fps_from_input)
+
+        self.input_path = self._add_browse_row(input_layout, "Path", self._browse_input)
+        self.input_path.editingFinished.connect(self._fps_debounce.start)
+        self.output_dir = self._add_browse_row(input_layout, "Output folder", self._browse_output)
 
         # Tools
         tools_box = QtWidgets.QGroupBox("Tools")
@@ -172,23 +476,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self.auto_install = QtWidgets.QCheckBox("Auto-install missing tools (recommended)")
         tools_layout.addRow("Auto-install", self.auto_install)
 
-        self.colmap_path = QtWidgets.QLineEdit()
-        colmap_browse = QtWidgets.QPushButton("Browse…")
-        colmap_browse.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        colmap_browse.clicked.connect(lambda: self._browse_exe(self.colmap_path, "Select COLMAP executable"))
-        colmap_row = QtWidgets.QHBoxLayout()
-        colmap_row.addWidget(self.colmap_path, 1)
-        colmap_row.addWidget(colmap_browse)
-        tools_layout.addRow("COLMAP path (optional)", colmap_row)
-
-        self.lichtfeld_path = QtWidgets.QLineEdit()
-        lf_browse = QtWidgets.QPushButton("Browse…")
-        lf_browse.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        lf_browse.clicked.connect(lambda: self._browse_exe(self.lichtfeld_path, "Select LichtFeld Studio executable"))
-        lf_row = QtWidgets.QHBoxLayout()
-        lf_row.addWidget(self.lichtfeld_path, 1)
-        lf_row.addWidget(lf_browse)
-        tools_layout.addRow("LichtFeld path (optional)", lf_row)
+        self.colmap_path = self._add_browse_row(
+            tools_layout,
+            "COLMAP path (optional)",
+            lambda: self._browse_exe(self.colmap_path, "Select COLMAP executable"),
+        )
+        self.lichtfeld_path = self._add_browse_row(
+            tools_layout,
+            "LichtFeld path (optional)",
+            lambda: self._browse_exe(self.lichtfeld_path, "Select LichtFeld Studio executable"),
+        )
 
         # Basic settings
         basic_box = QtWidgets.QGroupBox("Basic settings")
@@ -202,50 +499,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self.sf_enabled.setChecked(True)
         basic_layout.addRow("Frame sampling", self.sf_enabled)
 
-        self.sf_fps = NoWheelSpinBox()
-        self.sf_fps.setRange(1, 240)
-        self.sf_fps.setValue(10)
-        basic_layout.addRow("Video FPS sampling", self.sf_fps)
+        self.sf_fps = self._add_spin(basic_layout, "Video FPS sampling", 1, 240, 10)
 
         self.sf_method = NoWheelComboBox()
         self.sf_method.addItems(["best-n", "batched"])
         self.sf_method.setCurrentIndex(1)
         basic_layout.addRow("Sampling method", self.sf_method)
 
-        self.sf_num_frames = NoWheelSpinBox()
-        self.sf_num_frames.setRange(1, 50000)
-        self.sf_num_frames.setValue(300)
-        basic_layout.addRow("best-n: num_frames", self.sf_num_frames)
+        self.sf_num_frames = self._add_spin(basic_layout, "best-n: num_frames", 1, 50000, 300)
         self._sf_lbl_num_frames = basic_layout.labelForField(self.sf_num_frames)
 
-        self.sf_min_buffer = NoWheelSpinBox()
-        self.sf_min_buffer.setRange(0, 100)
-        self.sf_min_buffer.setValue(3)
-        basic_layout.addRow("best-n: min_buffer", self.sf_min_buffer)
+        self.sf_min_buffer = self._add_spin(basic_layout, "best-n: min_buffer", 0, 100, 3)
         self._sf_lbl_min_buffer = basic_layout.labelForField(self.sf_min_buffer)
 
-        self.sf_batch_size = NoWheelSpinBox()
-        self.sf_batch_size.setRange(1, 200)
-        self.sf_batch_size.setValue(5)
-        basic_layout.addRow("batched: batch_size", self.sf_batch_size)
+        self.sf_batch_size = self._add_spin(basic_layout, "batched: batch_size", 1, 200, 5)
         self._sf_lbl_batch_size = basic_layout.labelForField(self.sf_batch_size)
 
-        self.sf_batch_buffer = NoWheelSpinBox()
-        self.sf_batch_buffer.setRange(0, 100)
-        self.sf_batch_buffer.setValue(2)
-        basic_layout.addRow("batched: batch_buffer", self.sf_batch_buffer)
+        self.sf_batch_buffer = self._add_spin(basic_layout, "batched: batch_buffer", 0, 100, 2)
         self._sf_lbl_batch_buffer = basic_layout.labelForField(self.sf_batch_buffer)
 
-        self.sf_outlier_window = NoWheelSpinBox()
-        self.sf_outlier_window.setRange(1, 500)
-        self.sf_outlier_window.setValue(15)
-        basic_layout.addRow("outlier: window_size", self.sf_outlier_window)
+        self.sf_outlier_window = self._add_spin(basic_layout, "outlier: window_size", 1, 500, 15)
         self._sf_lbl_outlier_window = basic_layout.labelForField(self.sf_outlier_window)
 
-        self.sf_outlier_sens = NoWheelSpinBox()
-        self.sf_outlier_sens.setRange(0, 100)
-        self.sf_outlier_sens.setValue(50)
-        basic_layout.addRow("outlier: sensitivity", self.sf_outlier_sens)
+        self.sf_outlier_sens = self._add_spin(basic_layout, "outlier: sensitivity", 0, 100, 50)
         self._sf_lbl_outlier_sens = basic_layout.labelForField(self.sf_outlier_sens)
 
         self.sf_method.currentTextChanged.connect(self._sync_sf_method_fields)
@@ -261,21 +537,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.colmap_gpu.setChecked(True)
         basic_layout.addRow("COLMAP GPU", self.colmap_gpu)
 
-        self.colmap_max_img = NoWheelSpinBox()
-        self.colmap_max_img.setRange(800, 10000)
-        self.colmap_max_img.setValue(10000)
-        basic_layout.addRow("COLMAP max image size", self.colmap_max_img)
+        self.colmap_max_img = self._add_spin(basic_layout, "COLMAP max image size", 800, 10000, 10000)
 
         # LichtFeld
-        self.lfs_iters = NoWheelSpinBox()
-        self.lfs_iters.setRange(1000, 2000000)
-        self.lfs_iters.setValue(30000)
-        basic_layout.addRow("LichtFeld iterations", self.lfs_iters)
+        self.lfs_iters = self._add_spin(basic_layout, "LichtFeld iterations", 1000, 2000000, 30000)
 
-        self.lfs_max_cap = NoWheelSpinBox()
-        self.lfs_max_cap.setRange(10000, 50000000)
-        self.lfs_max_cap.setValue(1_000_000)
-        basic_layout.addRow("Max Gaussians", self.lfs_max_cap)
+        self.lfs_max_cap = self._add_spin(basic_layout, "Max Gaussians", 10000, 50000000, 1_000_000)
 
         self.lfs_strategy = NoWheelComboBox()
         self.lfs_strategy.addItems(["adc", "mcmc"])
@@ -288,19 +555,62 @@ class MainWindow(QtWidgets.QMainWindow):
         adv_box.setChecked(False)
         form_col.addWidget(adv_box)
         adv_outer = QtWidgets.QVBoxLayout(adv_box)
-        #adv_layout = QtWidgets.QFormLayout(adv_box)
-        #adv_layout.setRowWrapPolicy(QtWidgets.QFormLayout.WrapLongRows)
-        #adv_layout.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        # Built on first expand (or when a run needs the values); see _ensure_advanced.
+        self._adv_body = QtWidgets.QWidget()
+        self._adv_body.setVisible(False)
+        adv_outer.addWidget(self._adv_body)
+        self._advanced_built = False
+        self._saved_form: dict[str, object] = {}
+        adv_box.toggled.connect(self._on_advanced_toggled)
+
+        # Actions
+        btn_row = QtWidgets.QHBoxLayout()
+        form_col.addLayout(btn_row)
+        self.start_btn = QtWidgets.QPushButton("Start")
+        self.start_btn.clicked.connect(self._start)
+        btn_row.addWidget(self.start_btn)
+
+        self.open_btn = QtWidgets.QPushButton("Open output")
+        self.open_btn.setEnabled(False)
+        self.open_btn.clicked.connect(self._open_output)
+        btn_row.addWidget(self.open_btn)
+
+        btn_row.addStretch(1)
+
+        self._last_output: Path | None = None
+        self._last_cfg: PipelineConfig | None  = None
+        self._last_cfg_key: str | None = None
+        self._run_t0: float | None = None
+        self.stage_name: str | None = None
+        self._stage_t0: float | None = None
+        self._stage_durations: dict[str, float] = {} 
+
+        self._last_input_type: str | None = None
+        self.input_type.currentTextChanged.connect(self._sync_defaults)
+        self._sync_defaults()
+        self._load_settings()
+
+    def _late_init(self) -> None:
+        self.log.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+
+    def _on_advanced_toggled(self, checked: bool) -> None:
+        if checked:
+            self._ensure_advanced()
+        self._adv_body.setVisible(checked)
+
+    def _ensure_advanced(self) -> None:
+        if self._advanced_built:
+            return
+        self._advanced_built = True
+        adv_outer = QtWidgets.QVBoxLayout(self._adv_body)
+        adv_outer.setContentsMargins(0, 0, 0, 0)
 
         sf_adv = self._make_subsection(adv_outer, "SharpFrames")
         colmap_adv = self._make_subsection(adv_outer, "COLMAP")
         lf_adv = self._make_subsection(adv_outer, "LichtFeld")
         other_adv = self._make_subsection(adv_outer, "Other")
 
-        self.sf_width = NoWheelSpinBox()
-        self.sf_width.setRange(0, 8000)
-        self.sf_width.setValue(0)
-        sf_adv.addRow("Frame resize width (0 = keep)", self.sf_width)
+        self.sf_width = self._add_spin(sf_adv, "Frame resize width (0 = keep)", 0, 8000, 0)
 
         self.sf_format = NoWheelComboBox()
         self.sf_format.addItems(["jpg", "png"])
@@ -329,15 +639,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.colmap_single_cam.setChecked(True)
         colmap_adv.addRow("Single camera", self.colmap_single_cam)
 
-        self.colmap_sift_features = NoWheelSpinBox()
-        self.colmap_sift_features.setRange(1024, 50000)
-        self.colmap_sift_features.setValue(8192)
-        colmap_adv.addRow("Max SIFT features", self.colmap_sift_features)
+        self.colmap_sift_features = self._add_spin(colmap_adv, "Max SIFT features", 1024, 50000, 8192)
 
-        self.colmap_seq_overlap = NoWheelSpinBox()
-        self.colmap_seq_overlap.setRange(1, 50)
-        self.colmap_seq_overlap.setValue(10)
-        colmap_adv.addRow("Sequential overlap", self.colmap_seq_overlap)
+        self.colmap_seq_overlap = self._add_spin(colmap_adv, "Sequential overlap", 1, 50, 10)
 
         self.lfs_resize = NoWheelComboBox()
         self.lfs_resize.addItems(["auto", "1", "2", "4", "8"])
@@ -364,10 +668,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.lfs_save_eval.setChecked(True)
         lf_adv.addRow("Save eval images", self.lfs_save_eval)
 
-        self.lfs_test_every = NoWheelSpinBox()
-        self.lfs_test_every.setRange(1, 1000)
-        self.lfs_test_every.setValue(8)
-        lf_adv.addRow("Test every N-th image", self.lfs_test_every)
+        self.lfs_test_every = self._add_spin(lf_adv, "Test every N-th image", 1, 1000, 8)
 
         self.keep_intermediates = QtWidgets.QCheckBox("Keep intermediate files")
         self.keep_intermediates.setChecked(True)
@@ -377,33 +678,28 @@ class MainWindow(QtWidgets.QMainWindow):
         self.export_run_log.setChecked(True)
         other_adv.addRow("Logs", self.export_run_log)
 
-
         adv_outer.addStretch(1)
-
-        # Actions
-        btn_row = QtWidgets.QHBoxLayout()
-        form_col.addLayout(btn_row)
-        self.start_btn = QtWidgets.QPushButton("Start")
-        self.start_btn.clicked.connect(self._start)
-        btn_row.addWidget(self.start_btn)
-
-        self.open_btn = QtWidgets.QPushButton("Open output")
-        self.open_btn.setEnabled(False)
-        self.open_btn.clicked.connect(self._open_output)
-        btn_row.addWidget(self.open_btn)
-
-        btn_row.addStretch(1)
-
-        self._last_output: Path | None = None
-        self._last_cfg: PipelineConfig | None  = None
-        self._run_t0: float | None = None
-        self.stage_name: str | None = None
-        self._stage_t0: float | None = None
-        self._stage_durations: dict[str, float] = {} 
-
-        self.input_type.currentTextChanged.connect(self._sync_defaults)
-        self._sync_defaults()
-        self._load_settings()
+        self._apply_form(self._saved_form, self._ADVANCED_WIDGETS)
+
+    def _add_browse_row(
+        self, form: QtWidgets.QFormLayout, label: str, on_click: Callable[[], object]
+    ) -> QtWidgets.QLineEdit:
+        edit = QtWidgets.QLineEdit()
+        browse = QtWidgets.QPushButton("Browse…")
+        browse.setSizePolicy(_FIXED_POLICY)
+        browse.clicked.connect(on_click)
+        row = QtWidgets.QHBoxLayout()
+        row.addWidget(edit, 1)
+        row.addWidget(browse)
+        form.addRow(label, row)
+        return edit
+
+    def _add_spin(self, form: QtWidgets.QFormLayout, label: str, lo: int, hi: int, value: int) -> NoWheelSpinBox:
+        spin = NoWheelSpinBox()
+        spin.setRange(lo, hi)
+        spin.setValue(value)
+        form.addRow(label, spin)
+        return spin
 
     def _make_subsection(self, adv_outer: QVBoxLayout, title: str) -> QtWidgets.QFormLayout:
         box = QtWidgets.QGroupBox(title)
@@ -415,25 +711,72 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _load_settings(self) -> None:
         s = self.settings_store.load()
-        self.auto_install.setChecked(bool(s.auto_install_tools))
-        self.colmap_path.setText(s.tool_paths.colmap or "")
-        self.lichtfeld_path.setText(s.tool_paths.lichtfeld or "")
+        with (
+            QtCore.QSignalBlocker(self.auto_install),
+            QtCore.QSignalBlocker(self.colmap_path),
+            QtCore.QSignalBlocker(self.lichtfeld_path),
+        ):
+            self.auto_install.setChecked(bool(s.auto_install_tools))
+            self.colmap_path.setText(s.tool_paths.colmap or "")
+            self.lichtfeld_path.setText(s.tool_paths.lichtfeld or "")
+        # advanced widgets may not exist yet; _ensure_advanced applies the rest
+        self._saved_form = dict(s.form)
+        self._apply_form(self._saved_form, self._FORM_WIDGETS)
+
+    def _apply_form(self, values: dict[str, object], names: tuple[str, ...]) -> None:
+        for name in names:
+            w = getattr(self, name, None)
+            if w is None or name not in values:
+                continue
+            with QtCore.QSignalBlocker(w):
+                try:
+                    _set_widget_value(w, values[name])
+                except (TypeError, ValueError):
+                    pass
+        # signals were blocked: bring the dependent state in line by hand
+        self._last_input_type = self.input_type.currentText()
+        self._sync_sf_method_fields(self.sf_method.currentText())
 
-    def _save_settings(self) -> None:
+    def _save_settings(self) -> Settings:
         colmap = self.colmap_path.text().strip() or None
         lf = self.lichtfeld_path.text().strip() or None
         s = self.settings_store.load()
         s.auto_install_tools = self.auto_install.isChecked()
         s.tool_paths = ToolPaths(colmap=colmap, lichtfeld=lf)
+        form = dict(self._saved_form)
+        for name in self._FORM_WIDGETS:
+            w = getattr(self, name, None)
+            if w is not None:
+                form[name] = _widget_value(w)
+        s.form = self._saved_form = form
         self.settings_store.save(s)
+        return s
+
+    def _offer_reuse(self, last_run: dict[str, str], cfg_key: str) -> bool:
+        out = last_run.get("output_dir")
+        if last_run.get("config") != cfg_key or not out or not Path(out).is_dir():
+            return False
+        answer = QtWidgets.QMessageBox.question(
+            self,
+            "Reuse existing output?",
+            f"These settings match the last completed run.\n\nReuse its output in {out} instead of running again?",
+        )
+        if answer != QtWidgets.QMessageBox.Yes:
+            return False
+        self._last_output = Path(out)
+        self.open_btn.setEnabled(True)
+        self._append(f"Settings unchanged; reusing output of the last run: {out}")
+        return True
 
     def _sync_defaults(self) -> None:
         t = self.input_type.currentText()
+        if t == self._last_input_type:
+            return
+        self._last_input_type = t
+        with QtCore.QSignalBlocker(self.sf_enabled):
+            self.sf_enabled.setChecked(t == "video")
         if t == "video":
-            self.sf_enabled.setChecked(True)
-            self._apply_video_fps_from_input()
-        else:
-            self.sf_enabled.setChecked(False)
+            self._fps_debounce.start()
 
     def _set_row_visible(self, field: QtWidgets.QWidget, label: QtWidgets.QWidget | None, visible: bool) -> None:
         field.setVisible(visible)
@@ -444,54 +787,13 @@ class MainWindow(QtWidgets.QMainWindow):
         if p.is_file():
             return p
         if p.is_dir():
-            vids = [x for x in sorted(p.iterdir()) if x.is_file() and x.suffix.lower() in VIDEO_EXTS]
-            return vids[0] if vids else None
+            # alphabetically first video, in one pass without sorting the listing
+            with os.scandir(p) as it:
+                vids = (e for e in it if os.path.splitext(e.name)[1].lower() in VIDEO_EXTS and e.is_file())
+                first = min(vids, key=lambda e: e.name, default=None)
+            return Path(first.path) if first is not None else None
         return None
 
-    def _probe_fps_ffprobe(self, video: Path) -> float | None:
-        if shutil.which("ffprobe") is None:
-            return None
-        cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-select_streams",
-            "v:0",
-            "-show_entries",
-            "stream=avg_frame_rate",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            str(video),
-        ]
-        try:
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=10).strip()
-        except Exception:
-            return None
-        if not out or out == "0/0":
-            return None
-        try:
-            fps = float(Fraction(out)) if "/" in out else float(out)
-        except Exception:
-            return None
-        return fps if fps > 0 else None
-
-    def _probe_fps_cv2(self, video: Path) -> float | None:
-        try:
-            import cv2  # type: ignore
-        except Exception:
-            return None
-        cap = cv2.VideoCapture(str(video))
-        try:
-            if not cap.isOpened():
-                return None
-            fps = float(cap.get(cv2.CAP_PROP_FPS) or 0.0)
-            return fps if fps > 0 else None
-        finally:
-            cap.release()
-
-    def _infer_video_fps(self, video: Path) -> float | None:
-        return self._probe_fps_ffprobe(video) or self._probe_fps_cv2(video)
-
     def _apply_video_fps_from_input(self) -> None:
         if self.input_type.currentText() != "video":
             return
@@ -504,7 +806,32 @@ class MainWindow(QtWidgets.QMainWindow):
         video = self._first_video_in_path(p)
         if not video:
             return
-        fps = self._infer_video_fps(video)
+        key = _video_key(video)
+        if key is None:
+            return
+        self._fps_wanted = key
+        if key in self._fps_cache:
+            self._set_probed_fps(self._fps_cache[key])
+            return
+        if key in self._fps_probes:
+            return
+        probe = FpsProbeRunnable(video, key)
+        probe.signals.probed.connect(self._on_fps_probed, QtCore.Qt.QueuedConnection)
+        # keep the Python wrapper alive until it reports back
+        self._fps_probes[key] = probe
+        QtCore.QThreadPool.globalInstance().start(probe)
+
+    def _on_fps_probed(self, key: tuple[str, int, int], fps: float | None) -> None:
+        self._fps_probes.pop(key, None)
+        if len(self._fps_cache) >= _FPS_CACHE_MAX:
+            del self._fps_cache[next(iter(self._fps_cache))]  # oldest entry
+        self._fps_cache[key] = fps
+        _save_fps_cache(self._fps_cache_path, self._fps_cache)
+        # the input may have moved on while the probe ran
+        if key == self._fps_wanted:
+            self._set_probed_fps(fps)
+
+    def _set_probed_fps(self, fps: float | None) -> None:
         if not fps:
             return
         fps_i = max(1, int(round(fps)))
@@ -516,20 +843,27 @@ class MainWindow(QtWidgets.QMainWindow):
         show_batched = method == "batched"
         show_outlier = method == "outlier-removal"
 
-        self._set_row_visible(self.sf_num_frames, self._sf_lbl_num_frames, show_best)
-        self._set_row_visible(self.sf_min_buffer, self._sf_lbl_min_buffer, show_best)
-        
-        self._set_row_visible(self.sf_batch_size, self._sf_lbl_batch_size, show_batched)
-        self._set_row_visible(self.sf_batch_buffer, self._sf_lbl_batch_buffer, show_batched)
+        # six show/hide toggles, one relayout/repaint
+        parent = self.sf_num_frames.parentWidget()
+        parent.setUpdatesEnabled(False)
+        try:
+            self._set_row_visible(self.sf_num_frames, self._sf_lbl_num_frames, show_best)
+            self._set_row_visible(self.sf_min_buffer, self._sf_lbl_min_buffer, show_best)
+
+            self._set_row_visible(self.sf_batch_size, self._sf_lbl_batch_size, show_batched)
+            self._set_row_visible(self.sf_batch_buffer, self._sf_lbl_batch_buffer, show_batched)
 
-        self._set_row_visible(self.sf_outlier_window, self._sf_lbl_outlier_window, show_outlier)
-        self._set_row_visible(self.sf_outlier_sens, self._sf_lbl_outlier_sens, show_outlier)
+            self._set_row_visible(self.sf_outlier_window, self._sf_lbl_outlier_window, show_outlier)
+            self._set_row_visible(self.sf_outlier_sens, self._sf_lbl_outlier_sens, show_outlier)
+        finally:
+            parent.setUpdatesEnabled(True)
 
     def _browse_input(self) -> None:
         t = self.input_type.currentText()
         if t == "images":
-            path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select images folder")
+            path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select images folder", self._last_browse_dir)
             if path:
+                self._remember_browse(path)
                 self.input_path.setText(path)
         else:
             m = QtWidgets.QMessageBox(self)
@@ -543,69 +877,48 @@ class MainWindow(QtWidgets.QMainWindow):
             clicked = m.clickedButton()
             if clicked == file_btn:
                 path, _ = QtWidgets.QFileDialog.getOpenFileName(
-                    self, "Select video file", filter="Video files (*.mp4 *.mov *.mkv *.avi *.m4v *.webm);;All files (*)"
+                    self, "Select video file", self._last_browse_dir, filter="Video files (*.mp4 *.mov *.mkv *.avi *.m4v *.webm);;All files (*)"
                 )
             elif clicked == dir_btn:
-                path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select folder with videos")
+                path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select folder with videos", self._last_browse_dir)
             else:
                 return
             if path:
+                self._remember_browse(path)
                 self.input_path.setText(path)
+                self._fps_debounce.start()
 
     def _browse_output(self) -> None:
-        path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select output folder")
+        path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select output folder", self._last_browse_dir)
         if path:
+            self._remember_browse(path)
             self.output_dir.setText(path)
 
 
     def _browse_exe(self, target: QtWidgets.QLineEdit, title: str) -> None:
-        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, title, filter="Executable (*)")
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, title, self._last_browse_dir, filter="Executable (*)")
         if path:
+            self._remember_browse(path)
             target.setText(path)
 
+    def _remember_browse(self, path: str) -> None:
+        self._last_browse_dir = str(Path(path).parent)
+
     def _build_config(self) -> PipelineConfig:
+        self._ensure_advanced()
         input_type = self.input_type.currentText()
         input_path = self.input_path.text().strip()
         output_dir = self.output_dir.text().strip()
 
         cfg = PipelineConfig.defaults(input_type=input_type, input_path=input_path, output_dir=output_dir)
 
-        cfg.frame_sampling.enabled = self.sf_enabled.isChecked()
-        cfg.frame_sampling.selection_method = self.sf_method.currentText()
-        cfg.frame_sampling.num_frames = int(self.sf_num_frames.value())
-        cfg.frame_sampling.fps = int(self.sf_fps.value())
-        cfg.frame_sampling.width = int(self.sf_width.value())
-        cfg.frame_sampling.format = self.sf_format.currentText()
-
-        cfg.frame_sampling.min_buffer = int(self.sf_min_buffer.value())
-        cfg.frame_sampling.batch_size = int(self.sf_batch_size.value())
-        cfg.frame_sampling.batch_buffer = int(self.sf_batch_buffer.value())
-        cfg.frame_sampling.outlier_window_size = int(self.sf_outlier_window.value())
-        cfg.frame_sampling.outlier_sensitivity = int(self.sf_outlier_sens.value())
-
-        cfg.colmap.matcher = self.colmap_matcher.currentText()
-        cfg.colmap.use_gpu = self.colmap_gpu.isChecked()
-        cfg.colmap.max_image_size = int(self.colmap_max_img.value())
-        cfg.colmap.camera_model = self.colmap_camera_model.currentText() or "PINHOLE"
-        cfg.colmap.single_camera = self.colmap_single_cam.isChecked()
-
-        cfg.colmap.sift_max_num_features = int(self.colmap_sift_features.value())
-        cfg.colmap.sequential_overlap = int(self.colmap_seq_overlap.value())
-
-        cfg.lichtfeld.iterations = int(self.lfs_iters.value())
-        cfg.lichtfeld.max_cap = int(self.lfs_max_cap.value())
-        cfg.lichtfeld.strategy = self.lfs_strategy.currentText()
-        cfg.lichtfeld.resize_factor = self.lfs_resize.currentText()
-
-        cfg.lichtfeld.eval = self.lfs_eval.isChecked()
-        cfg.lichtfeld.save_eval_images = self.lfs_save_eval.isChecked()
-        cfg.lichtfeld.test_every = int(self.lfs_test_every.value())
-
-        cfg.lichtfeld.gut = self.lfs_gut.isChecked()
-        cfg.lichtfeld.ppisp_controller = self.lfs_ppisp.isChecked()
-        cfg.lichtfeld.mip_filter = self.lfs_mip.isChecked()
-
-        cfg.output.keep_intermediates = self.keep_intermediates.isChecked()
+        # one replace() per section instead of a setattr per field
+        sections: dict[str, dict[str, object]] = {}
+        for section, field, widget in self._CONFIG_MAP:
+            sections.setdefault(section, {})[field] = _widget_value(getattr(self, widget))
+        sections["colmap"]["camera_model"] = sections["colmap"]["camera_model"] or "PINHOLE"
+        for section, values in sections.items():
+            setattr(cfg, section, replace(getattr(cfg, section), **values))
         return cfg
 
     def _start(self) -> None:
@@ -613,9 +926,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self._last_output = None
         self._last_cfg = None
 
-        self._save_settings()
+        settings = self._save_settings()
         cfg = self._build_config()
+        cfg_key = _config_key(cfg)
+        if self._offer_reuse(settings.last_run, cfg_key):
+            return
+        self._last_cfg_key = cfg_key
         self.log.clear()
+        self._log_buffer.clear()
+        self._run_log.clear()
         self._append("Starting…")
 
         self._last_cfg = cfg
@@ -624,27 +943,34 @@ class MainWindow(QtWidgets.QMainWindow):
         self._stage_t0 = None
         self._stage_durations = {}
 
-        thread = QtCore.QThread(self)
-        worker = PipelineWorker(cfg)
-        worker.moveToThread(thread)
-
-        thread.started.connect(worker.run)
-        worker.log_line.connect(self._append)
-        worker.stage.connect(self._on_stage)
-        worker.finished.connect(self._on_finished)
-        worker.failed.connect(self._on_failed)
-
-        worker.finished.connect(thread.quit)
-        worker.failed.connect(thread.quit)
-        thread.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
+        # The pipeline mostly waits on subprocesses, so a plain Python thread is
+        # enough; daemon so closing the window never waits on a long training run.
+        if self._pipeline is None:
+            self._pipeline = SplatPipeline(paths=self.paths)
+        self._worker.take_events()  # nothing from an earlier run may leak in
+        thread = threading.Thread(
+            target=self._worker.run, args=(cfg, self._pipeline), name="splatflow-pipeline", daemon=True
+        )
 
         self._thread = thread
-        self._worker = worker
         self.start_btn.setEnabled(False)
         thread.start()
 
+    def _drain_worker_events(self) -> None:
+        lines: list[str] = []
+        for kind, text in self._worker.take_events():
+            if kind == "log":
+                lines.append(text)
+                continue
+            if lines:
+                self._append("\n".join(lines))
+                lines = []
+            self._on_stage(text)
+        if lines:
+            self._append("\n".join(lines))
+
     def _on_finished(self, result: object) -> None:
+        self._drain_worker_events()
         self.start_btn.setEnabled(True)
         self._finalize_stage_timing()
         total = 0.0
@@ -655,12 +981,16 @@ class MainWindow(QtWidgets.QMainWindow):
             if out:
                 self._last_output = Path(out)
                 self.open_btn.setEnabled(True)
+                s = self.settings_store.load()
+                s.last_run = {"config": self._last_cfg_key or "", "output_dir": str(out)}
+                self.settings_store.save(s)
         finally:
             self._append("\nFinished.")
             self._append_timing_summary(total)
             self._export_run_log(self._last_output)
 
     def _on_failed(self, message: str) -> None:
+        self._drain_worker_events()
         self.start_btn.setEnabled(True)
         QtWidgets.QMessageBox.critical(self, "Pipeline failed", message)
         self._append("\nFAILED: " + message)
@@ -672,7 +1002,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self._export_run_log(self._last_output)
 
     def _append(self, line: str) -> None:
-        self.log.appendPlainText(line)
+        self._log_buffer.append(line)
+        self._run_log.append(line)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        if self._log_buffer:
+            self.log.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     def _on_stage(self, stage: str) -> None:
         now = time.perf_counter()
@@ -717,10 +1055,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self._append(f"Total:       {self._fmt_secs(total_sec)}")
 
     def _export_run_log(self, out_dir: Path | None) -> None:
-        if not getattr(self, "export_run_log", None) or not self.export_run_log.isChecked():
+        self._ensure_advanced()
+        if not self.export_run_log.isChecked():
             return
 
-        text = self.log.toPlainText()
+        text = "\n".join(self._run_log)
         if not text.strip():
             return
 
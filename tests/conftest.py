@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 
@@ -5,3 +6,14 @@ ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+import pytest
+
+from splatflow.backend.paths import AppPaths
+
+
+@pytest.fixture(scope="session")
+def app_paths(tmp_path_factory: pytest.TempPathFactory) -> AppPaths:
+    """One AppPaths tree per session (per xdist worker), for tests that only need somewhere to point."""
+    root = tmp_path_factory.mktemp(f"splatflow-{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}")
+    return AppPaths(data_dir_override=str(root / "data"), config_dir_override=str(root / "cfg")).ensure()
@@ -1,20 +1,51 @@
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import wait
 from pathlib import Path
+from typing import Final
 
+import pytest
+import requests
+
+from splatflow.backend import toolchain as toolchain_mod
+from splatflow.backend.errors import ToolNotFoundError
 from splatflow.backend.paths import AppPaths
 from splatflow.backend.settings import Settings, ToolPaths
-from splatflow.backend.toolchain import Toolchain
+from splatflow.backend.toolchain import Toolchain, ToolExec
 from splatflow.backend.schema import FrameSamplingConfig, ColmapConfig, LichtfeldConfig
 from splatflow.backend.tools.sharp_frames import SharpFramesArgs
-from splatflow.backend.tools.colmap import ColmapProject, feature_extractor_cmd, matcher_cmd, undistort_cmd
+from splatflow.backend.tools.colmap import ColmapProject, feature_extractor_cmd, matcher_cmd
 from splatflow.backend.tools.lichtfeld import LichtfeldTrainArgs
 
 
+# canned `colmap feature_extractor -h` output for the three option layouts we support
+_FE_HELP_HYBRID: Final[str] = """
+    --ImageReader.camera_model arg (=SIMPLE_RADIAL)
+    --ImageReader.single_camera arg (=0)
+    --FeatureExtraction.use_gpu arg (=1)
+    --SiftExtraction.max_image_size arg (=3200)
+    --SiftExtraction.num_threads arg (=-1)
+    --SiftExtraction.max_num_features arg (=8192)
+"""
+_FE_HELP_FE: Final[str] = """
+    --FeatureExtraction.max_image_size arg (=3200)
+    --FeatureExtraction.num_threads arg (=-1)
+    --FeatureExtraction.use_gpu arg (=1)
+    --SiftExtraction.max_num_features arg (=8192)
+"""
+_FE_HELP_NO_GPU: Final[str] = """
+    --FeatureExtraction.max_image_size arg (=3200)
+    --SiftExtraction.max_num_features arg (=8192)
+"""
+
+
 class FakeRunner:
     def __init__(self, which_map: dict[str, str], help_map: dict[str, str] | None = None) -> None:
         self.which_map = which_map
         self.help_map = help_map or {}
+        self.help_calls: list[str] = []
 
     def which(self, exe: str) -> str | None:
         return self.which_map.get(exe)
@@ -34,14 +65,33 @@ class FakeRunner:
         if idx < 1:
             return ""
         subcmd = cmd[idx - 1]
+        self.help_calls.append(subcmd)
         return self.help_map.get(subcmd, "")
 
 
-def test_sharp_frames_builds_expected_command_video(tmp_path: Path) -> None:
-    paths = AppPaths(data_dir_override=str(tmp_path / "data"), config_dir_override=str(tmp_path / "cfg")).ensure()
-    settings = Settings(tool_paths=ToolPaths(), auto_install_tools=False)
-    runner = FakeRunner({"sharp-frames": "/usr/bin/sharp-frames"})
-    tc = Toolchain(paths=paths, settings=settings, runner=runner)  # type: ignore[arg-type]
+@pytest.fixture
+def make_tc(app_paths: AppPaths):
+    """Toolchain factory over the session-wide AppPaths; only the runner/settings vary."""
+    # COLMAP help output is persisted under tools/; don't let one test's fake
+    # help text answer for another's
+    (app_paths.tools_dir / "colmap" / "options.json").unlink(missing_ok=True)
+
+    def _mk(
+        which_map: dict[str, str] | None = None,
+        help_map: dict[str, str] | None = None,
+        *,
+        tool_paths: ToolPaths | None = None,
+        runner: FakeRunner | None = None,
+    ) -> Toolchain:
+        settings = Settings(tool_paths=tool_paths or ToolPaths(), auto_install_tools=False)
+        runner = runner or FakeRunner(which_map or {}, help_map)
+        return Toolchain(paths=app_paths, settings=settings, runner=runner)  # type: ignore[arg-type]
+
+    return _mk
+
+
+def test_sharp_frames_builds_expected_command_video(make_tc) -> None:
+    tc = make_tc({"sharp-frames": "/usr/bin/sharp-frames"})
 
     cfg = FrameSamplingConfig(enabled=True, selection_method="best-n", fps=12, num_frames=123)
     args = SharpFramesArgs(input_path=Path("in.mp4"), output_dir=Path("out"), input_type="video", config=cfg)
@@ -53,19 +103,8 @@ def test_sharp_frames_builds_expected_command_video(tmp_path: Path) -> None:
     assert "123" in cmd
 
 
-def test_colmap_feature_extractor_resolves_hybrid_flag_names(tmp_path: Path) -> None:
-    paths = AppPaths(data_dir_override=str(tmp_path / "data"), config_dir_override=str(tmp_path / "cfg")).ensure()
-    settings = Settings(tool_paths=ToolPaths(), auto_install_tools=False)
-    help_text = """
-        --ImageReader.camera_model arg (=SIMPLE_RADIAL)
-        --ImageReader.single_camera arg (=0)
-        --FeatureExtraction.use_gpu arg (=1)
-        --SiftExtraction.max_image_size arg (=3200)
-        --SiftExtraction.num_threads arg (=-1)
-        --SiftExtraction.max_num_features arg (=8192)
-    """
-    runner = FakeRunner({"colmap": "/usr/bin/colmap"}, {"feature_extractor": help_text})
-    tc = Toolchain(paths=paths, settings=settings, runner=runner)  # type: ignore[arg-type]
+def test_colmap_feature_extractor_resolves_hybrid_flag_names(make_tc) -> None:
+    tc = make_tc({"colmap": "/usr/bin/colmap"}, {"feature_extractor": _FE_HELP_HYBRID})
 
     proj = ColmapProject(
         images_dir=Path("images"),
@@ -84,18 +123,14 @@ def test_colmap_feature_extractor_resolves_hybrid_flag_names(tmp_path: Path) ->
     assert "--SiftExtraction.max_image_size" in cmd
     assert "4000" in cmd
 
+    # help output is parsed once per toolchain; rebuilding the command must not re-run it
+    assert tc.runner.help_calls == ["feature_extractor"]
+    assert feature_extractor_cmd(tc, proj, cfg)[0] == cmd
+    assert tc.runner.help_calls == ["feature_extractor"]
 
-def test_colmap_feature_extractor_uses_featureextraction_when_available(tmp_path: Path) -> None:
-    paths = AppPaths(data_dir_override=str(tmp_path / "data"), config_dir_override=str(tmp_path / "cfg")).ensure()
-    settings = Settings(tool_paths=ToolPaths(), auto_install_tools=False)
-    help_text = """
-        --FeatureExtraction.max_image_size arg (=3200)
-        --FeatureExtraction.num_threads arg (=-1)
-        --FeatureExtraction.use_gpu arg (=1)
-        --SiftExtraction.max_num_features arg (=8192)
-    """
-    runner = FakeRunner({"colmap": "/usr/bin/colmap"}, {"feature_extractor": help_text})
-    tc = Toolchain(paths=paths, settings=settings, runner=runner)  # type: ignore[arg-type]
+
+def test_colmap_feature_extractor_uses_featureextraction_when_available(make_tc) -> None:
+    tc = make_tc({"colmap": "/usr/bin/colmap"}, {"feature_extractor": _FE_HELP_FE})
 
     proj = ColmapProject(
         images_dir=Path("images"),
@@ -112,15 +147,8 @@ def test_colmap_feature_extractor_uses_featureextraction_when_available(tmp_path
     assert "7" in cmd
 
 
-def test_colmap_feature_extractor_omits_gpu_flag_if_not_supported(tmp_path: Path) -> None:
-    paths = AppPaths(data_dir_override=str(tmp_path / "data"), config_dir_override=str(tmp_path / "cfg")).ensure()
-    settings = Settings(tool_paths=ToolPaths(), auto_install_tools=False)
-    help_text = """
-        --FeatureExtraction.max_image_size arg (=3200)
-        --SiftExtraction.max_num_features arg (=8192)
-    """
-    runner = FakeRunner({"colmap": "/usr/bin/colmap"}, {"feature_extractor": help_text})
-    tc = Toolchain(paths=paths, settings=settings, runner=runner)  # type: ignore[arg-type]
+def test_colmap_feature_extractor_omits_gpu_flag_if_not_supported(make_tc) -> None:
+    tc = make_tc({"colmap": "/usr/bin/colmap"}, {"feature_extractor": _FE_HELP_NO_GPU})
 
     proj = ColmapProject(
         images_dir=Path("images"),
@@ -133,13 +161,10 @@ def test_colmap_feature_extractor_omits_gpu_flag_if_not_supported(tmp_path: Path
     assert not any("use_gpu" in x for x in cmd)
 
 
-def test_lichtfeld_train_has_required_args(tmp_path: Path) -> None:
-    paths = AppPaths(data_dir_override=str(tmp_path / "data"), config_dir_override=str(tmp_path / "cfg")).ensure()
+def test_lichtfeld_train_has_required_args(tmp_path: Path, make_tc) -> None:
     lf = tmp_path / "LichtFeld-Studio"
     lf.write_text("x")
-    settings = Settings(tool_paths=ToolPaths(lichtfeld=str(lf)), auto_install_tools=False)
-    runner = FakeRunner({})
-    tc = Toolchain(paths=paths, settings=settings, runner=runner)  # type: ignore[arg-type]
+    tc = make_tc(tool_paths=ToolPaths(lichtfeld=str(lf)))
 
     cfg = LichtfeldConfig(iterations=111, max_cap=222, strategy="mcmc", resize_factor="2")
     args = LichtfeldTrainArgs(data_path=Path("dataset"), output_path=Path("out"), config=cfg)
@@ -151,13 +176,10 @@ def test_lichtfeld_train_has_required_args(tmp_path: Path) -> None:
     assert "--max-cap" in cmd and "222" in cmd
 
 
-def test_lichtfeld_train_includes_optional_flags_when_enabled(tmp_path: Path) -> None:
-    paths = AppPaths(data_dir_override=str(tmp_path / "data"), config_dir_override=str(tmp_path / "cfg")).ensure()
+def test_lichtfeld_train_includes_optional_flags_when_enabled(tmp_path: Path, make_tc) -> None:
     lf = tmp_path / "LichtFeld-Studio"
     lf.write_text("x")
-    settings = Settings(tool_paths=ToolPaths(lichtfeld=str(lf)), auto_install_tools=False)
-    runner = FakeRunner({})
-    tc = Toolchain(paths=paths, settings=settings, runner=runner)  # type: ignore[arg-type]
+    tc = make_tc(tool_paths=ToolPaths(lichtfeld=str(lf)))
 
     cfg = LichtfeldConfig(
         iterations=111,
@@ -173,3 +195,152 @@ def test_lichtfeld_train_includes_optional_flags_when_enabled(tmp_path: Path) ->
     assert "--gut" in cmd
     assert "--ppisp-controller" in cmd
     assert "--enable-mip" in cmd
+
+
+def test_colmap_exec_is_resolved_once_until_invalidated(make_tc) -> None:
+    lookups: list[str] = []
+
+    class CountingRunner(FakeRunner):
+        def which(self, exe: str) -> str | None:
+            lookups.append(exe)
+            return super().which(exe)
+
+    tc = make_tc(runner=CountingRunner({"colmap": "/usr/bin/colmap"}))
+
+    first = tc.colmap_exec()
+    assert tc.colmap_exec() is first
+    assert lookups == ["colmap"]
+
+    tc.invalidate_tool_cache()
+    tc.colmap_exec()
+    assert lookups == ["colmap", "colmap"]
+
+
+def test_colmap_options_are_persisted_across_toolchains(make_tc) -> None:
+    help_text = "--FeatureExtraction.use_gpu arg (=1)\n"
+    runner = FakeRunner({"colmap": "/usr/bin/colmap"}, {"feature_extractor": help_text})
+    tc = make_tc(runner=runner)
+    assert tc.colmap_options("feature_extractor") == frozenset({"FeatureExtraction.use_gpu"})
+
+    runner.help_map = {}
+    fresh = make_tc(runner=runner)
+    assert fresh.colmap_options("feature_extractor") == frozenset({"FeatureExtraction.use_gpu"})
+
+
+def test_prewarmed_colmap_options_are_used_by_command_builders(make_tc) -> None:
+    help_text = "--SequentialMatching.overlap arg (=10)\n"
+    tc = make_tc({"colmap": "/usr/bin/colmap"}, {"sequential_matcher": help_text})
+
+    tc.prewarm_colmap_options(["feature_extractor", "sequential_matcher"])
+    proj = ColmapProject(
+        images_dir=Path("images"),
+        database_path=Path("database.db"),
+        sparse_dir=Path("sparse"),
+        undistorted_dir=Path("undistorted"),
+    )
+    cmd, _ = matcher_cmd(tc, proj, ColmapConfig(matcher="sequential", sequential_overlap=4))
+    assert "--SequentialMatching.overlap" in cmd
+    assert "4" in cmd
+
+
+def test_release_lookup_is_cached_and_revalidated_with_etag(tmp_path: Path, monkeypatch) -> None:
+    calls: list[dict[str, str]] = []
+
+    class Resp:
+        def __init__(self, status: int) -> None:
+            self.status_code = status
+            self.url = "https://github.com/colmap/colmap/releases/tag/3.11.1"
+            self.headers = {"ETag": '"abc"'}
+            self.text = "<html>release page</html>"
+
+        def raise_for_status(self) -> None:
+            if self.status_code >= 400:
+                raise requests.HTTPError(str(self.status_code))
+
+    statuses = iter([200, 304, 403])
+
+    def fake_get(url, *, headers, **kwargs):
+        calls.append(dict(headers))
+        return Resp(next(statuses))
+
+    monkeypatch.setattr(toolchain_mod.requests, "get", fake_get)
+    paths = AppPaths(data_dir_override=str(tmp_path / "data"), config_dir_override=str(tmp_path / "cfg")).ensure()
+    toolchain = Toolchain(paths=paths, settings=Settings(), runner=FakeRunner({}))
+
+    assert toolchain._resolve_latest_colmap_release() == "3.11.1"
+    assert toolchain._resolve_latest_colmap_release() == "3.11.1"
+    assert len(calls) == 1  # fresh cache, no network
+
+    cache = paths.tools_dir / "colmap" / "latest.json"
+    assert "release page" not in cache.read_text(encoding="utf-8")
+    os.utime(cache, (0, 0))
+    assert toolchain._resolve_latest_colmap_release() == "3.11.1"  # 304
+    assert calls[-1]["If-None-Match"] == '"abc"'
+
+    os.utime(cache, (0, 0))
+    assert toolchain._resolve_latest_colmap_release() == "3.11.1"  # rate-limited, stale copy
+    assert len(calls) == 3
+
+
+def test_colmap_install_race_prefers_official_build_when_both_succeed(
+    make_tc, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tc = make_tc()
+    official = ToolExec(exe=Path("COLMAP.bat"), prefix=["COLMAP.bat"], env={})
+    conda = ToolExec(exe=Path("colmap"), prefix=["colmap"], env={})
+    tc._colmap_official_exec = lambda: official
+    tc._colmap_conda_exec = lambda: conda
+
+    def conda_reported_first(futures):
+        wait(futures)
+        return reversed(futures)
+
+    monkeypatch.setattr(toolchain_mod, "as_completed", conda_reported_first)
+    assert tc._race_colmap_installs() is official
+
+
+def test_colmap_flags_are_cached_per_candidate_table(make_tc) -> None:
+    tc = make_tc({"colmap": "/usr/bin/colmap"}, {"feature_extractor": _FE_HELP_FE})
+
+    gpu = tc.colmap_flags(
+        "feature_extractor", {"use_gpu": ["SiftExtraction.use_gpu", "FeatureExtraction.use_gpu"]}
+    )
+    size = tc.colmap_flags("feature_extractor", {"max_image_size": ["FeatureExtraction.max_image_size"]})
+
+    assert gpu == {"use_gpu": "FeatureExtraction.use_gpu"}
+    assert size == {"max_image_size": "FeatureExtraction.max_image_size"}
+
+
+def test_concurrent_colmap_races_share_one_install(make_tc) -> None:
+    started, release = threading.Event(), threading.Event()
+    calls: list[int] = []
+    official = ToolExec(exe=Path("COLMAP.bat"), prefix=["COLMAP.bat"], env={})
+
+    def official_exec() -> ToolExec:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return official
+
+    def conda_exec() -> ToolExec:
+        raise ToolNotFoundError("no conda here")
+
+    first, second = make_tc(), make_tc()
+    for tc in (first, second):
+        tc._colmap_official_exec = official_exec
+        tc._colmap_conda_exec = conda_exec
+
+    results: list[ToolExec] = []
+    threads = [
+        threading.Thread(target=lambda tc=tc: results.append(tc._race_colmap_installs()))
+        for tc in (first, second)
+    ]
+    threads[0].start()
+    assert started.wait(5)
+    threads[1].start()
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert results == [official, official]
+    assert len(calls) == 1
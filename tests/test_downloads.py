@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import io
+import os
+import tarfile
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+import requests
+
+from splatflow.backend import downloads
+from splatflow.backend.downloads import (
+    download_and_extract_tar_bz2,
+    download_file,
+    extract_zip,
+    find_files,
+)
+
+
+_ETAG = '"v1"'
+
+
+class _AssetServer(ThreadingHTTPServer):
+    """Serves one in-memory file with byte ranges, ETag/If-Range and injectable faults."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _AssetHandler)
+        self.body = bytes(range(256)) * 4096
+        self.etag = _ETAG
+        # cut the body of the first GET short after this many bytes
+        self.drop_first_get_after: int | None = None
+        # (body, etag) the asset is replaced with once the first GET has been answered
+        self.replace_after_first_get: tuple[bytes, str] | None = None
+        # answer ranged GETs with a server error
+        self.fail_ranges = False
+        # 1-based numbers of GETs that are hung up on before any response is sent
+        self.hang_up_on_gets: set[int] = set()
+        self.accept_ranges_header = True
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/asset.bin"
+
+    def gets(self) -> list[dict[str, str]]:
+        return [headers for method, headers in self.requests if method == "GET"]
+
+
+class _AssetHandler(BaseHTTPRequestHandler):
+    server: _AssetServer
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        pass
+
+    def do_HEAD(self) -> None:
+        self._serve(head=True)
+
+    def do_GET(self) -> None:
+        self._serve(head=False)
+
+    def _serve(self, *, head: bool) -> None:
+        srv = self.server
+        with srv.lock:
+            srv.requests.append((self.command, dict(self.headers)))
+            n_get = len(srv.gets()) if self.command == "GET" else 0
+            first_get = n_get == 1
+        if n_get in srv.hang_up_on_gets:
+            self.close_connection = True
+            return
+
+        body = srv.body
+        start, end, status = 0, len(body) - 1, 200
+        rng = self.headers.get("Range")
+        if rng and self.command == "GET" and srv.fail_ranges:
+            self.send_error(500)
+            return
+        if rng and self.headers.get("If-Range", srv.etag) == srv.etag:
+            first, _, last = rng.removeprefix("bytes=").partition("-")
+            start, end, status = int(first), int(last) if last else len(body) - 1, 206
+
+        payload = body[start : end + 1]
+        self.send_response(status)
+        if srv.accept_ranges_header:
+            self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", srv.etag)
+        self.send_header("Content-Length", str(len(payload)))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+        self.end_headers()
+        if head:
+            return
+        if first_get and srv.drop_first_get_after is not None:
+            payload = payload[: srv.drop_first_get_after]
+        self.wfile.write(payload)
+        if first_get and srv.replace_after_first_get is not None:
+            srv.body, srv.etag = srv.replace_after_first_get
+
+
+@pytest.fixture
+def asset_server() -> Iterator[_AssetServer]:
+    srv = _AssetServer()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield srv
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+
+def test_download_resumes_after_dropped_connection(tmp_path: Path, asset_server: _AssetServer) -> None:
+    # urllib3 drops a partially filled read, so only whole stream chunks survive the cut
+    asset_server.drop_first_get_after = 2 * downloads._STREAM_BUFSIZE + 1000
+    dest = tmp_path / "asset.bin"
+
+    res = download_file(asset_server.url, dest, connections=1)
+
+    assert dest.read_bytes() == asset_server.body
+    assert res.bytes == len(asset_server.body)
+    first, second = asset_server.gets()
+    assert "Range" not in first
+    assert second["Range"] == f"bytes={2 * downloads._STREAM_BUFSIZE}-"
+    assert second["If-Range"] == _ETAG
+
+
+def test_download_resume_survives_a_failed_reconnect(tmp_path: Path, asset_server: _AssetServer) -> None:
+    asset_server.drop_first_get_after = 2 * downloads._STREAM_BUFSIZE + 1000
+    asset_server.hang_up_on_gets = {2}
+    # a 206 is enough to resume; the header is optional
+    asset_server.accept_ranges_header = False
+    dest = tmp_path / "asset.bin"
+
+    download_file(asset_server.url, dest, connections=1)
+
+    assert dest.read_bytes() == asset_server.body
+    assert asset_server.gets()[2]["Range"] == f"bytes={2 * downloads._STREAM_BUFSIZE}-"
+
+
+def test_download_restarts_when_asset_changed_between_attempts(tmp_path: Path, asset_server: _AssetServer) -> None:
+    asset_server.drop_first_get_after = 2 * downloads._STREAM_BUFSIZE + 1000
+    new = asset_server.body[::-1]
+    asset_server.replace_after_first_get = (new, '"v2"')
+    dest = tmp_path / "asset.bin"
+
+    download_file(asset_server.url, dest, connections=1)
+
+    assert dest.read_bytes() == new
+    assert asset_server.gets()[1]["If-Range"] == _ETAG
+
+
+def test_download_fetches_large_files_in_parallel_ranges(
+    tmp_path: Path, asset_server: _AssetServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(downloads, "_PARALLEL_MIN_BYTES", 1024)
+    dest = tmp_path / "asset.bin"
+
+    download_file(asset_server.url, dest, connections=4)
+
+    assert dest.read_bytes() == asset_server.body
+    gets = asset_server.gets()
+    assert len(gets) == 4
+    assert all("Range" in h and h["If-Range"] == _ETAG for h in gets)
+
+
+def test_download_falls_back_to_single_stream_when_ranges_fail(
+    tmp_path: Path, asset_server: _AssetServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(downloads, "_PARALLEL_MIN_BYTES", 1024)
+    asset_server.fail_ranges = True
+    dest = tmp_path / "asset.bin"
+
+    download_file(asset_server.url, dest, connections=4)
+
+    assert dest.read_bytes() == asset_server.body
+    assert any("Range" not in h for h in asset_server.gets())
+
+
+def _tar_bz2(member: str, data: bytes) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:bz2") as tf:
+        info = tarfile.TarInfo(member)
+        info.size = len(data)
+        tf.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def test_tar_member_is_streamed_atomically_and_retried(tmp_path: Path, asset_server: _AssetServer) -> None:
+    data = os.urandom(600_000)  # incompressible, so the archive spans several reads
+    asset_server.body = _tar_bz2("bin/micromamba", data)
+    asset_server.drop_first_get_after = len(asset_server.body) // 2
+    dest = tmp_path / "micromamba"
+
+    download_and_extract_tar_bz2(asset_server.url, dest, member="bin/micromamba")
+
+    assert dest.read_bytes() == data
+    assert len(asset_server.gets()) == 2
+    assert not dest.with_name("micromamba.part").exists()
+
+
+def test_tar_member_download_leaves_nothing_behind_on_failure(tmp_path: Path, asset_server: _AssetServer) -> None:
+    asset_server.body = _tar_bz2("bin/micromamba", os.urandom(600_000))
+    asset_server.hang_up_on_gets = {1, 2}
+    dest = tmp_path / "micromamba"
+
+    with pytest.raises(requests.ConnectionError):
+        download_and_extract_tar_bz2(asset_server.url, dest, member="bin/micromamba", retries=1)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def _write_zip(path: Path, members: dict[str, bytes], compression: int) -> None:
+    with zipfile.ZipFile(path, "w", compression) as z:
+        for name, data in members.items():
+            z.writestr(name, data)
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_extract_zip_writes_members_and_returns_their_paths(tmp_path: Path, compression: int) -> None:
+    members = {f"bin/tool{i}.txt": bytes([i]) * (1000 + i) for i in range(5)}
+    archive = tmp_path / "a.zip"
+    _write_zip(archive, members, compression)
+
+    names = extract_zip(archive, tmp_path / "out")
+
+    assert names == list(members)
+    for name, data in members.items():
+        assert (tmp_path / "out" / name).read_bytes() == data
+
+
+def test_extract_zip_sanitizes_unsafe_names(tmp_path: Path) -> None:
+    archive = tmp_path / "a.zip"
+    _write_zip(archive, {"../evil.txt": b"e", "/abs/p.txt": b"p", "ok/f.txt": b"f"}, zipfile.ZIP_DEFLATED)
+    dest = tmp_path / "out"
+
+    names = extract_zip(archive, dest)
+
+    assert names == ["evil.txt", "abs/p.txt", "ok/f.txt"]
+    assert all((dest / n).is_file() for n in names)
+    assert not (tmp_path / "evil.txt").exists()
+
+
+def test_extract_zip_rejects_corrupt_stored_member(tmp_path: Path) -> None:
+    archive = tmp_path / "a.zip"
+    _write_zip(archive, {"a.txt": b"hello world" * 100, "b.txt": b"x" * 100}, zipfile.ZIP_STORED)
+    raw = bytearray(archive.read_bytes())
+    raw[raw.index(b"hello world")] ^= 0xFF
+    archive.write_bytes(raw)
+
+    with pytest.raises(zipfile.BadZipFile):
+        extract_zip(archive, tmp_path / "out")
+
+
+def test_find_files_keeps_first_match_per_name(tmp_path: Path) -> None:
+    for sub in ("a", "b/c"):
+        (tmp_path / sub).mkdir(parents=True)
+        (tmp_path / sub / "COLMAP.bat").write_text("x")
+    (tmp_path / "b" / "other.exe").write_text("x")
+
+    first = find_files(tmp_path, ["colmap.bat", "OTHER.EXE"])
+    every = find_files(tmp_path, ["colmap.bat"], first_match_per_name=False)
+
+    assert sorted(p.name for p in first) == ["COLMAP.bat", "other.exe"]
+    assert sorted(every) == sorted([tmp_path / "a" / "COLMAP.bat", tmp_path / "b" / "c" / "COLMAP.bat"])
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+from splatflow.backend.media import mp4_video_fps
+
+
+def _box(kind: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def _trak(handler: bytes, timescale: int, stts: list[tuple[int, int]], count: int | None = None) -> bytes:
+    hdlr = _box(b"hdlr", b"\0" * 8 + handler + b"\0" * 12)
+    mdhd = _box(b"mdhd", b"\0" * 4 + b"\0" * 8 + struct.pack(">II", timescale, 0) + b"\0" * 4)
+    entries = b"".join(struct.pack(">II", n, d) for n, d in stts)
+    stbl = _box(b"stbl", _box(b"stts", b"\0" * 4 + struct.pack(">I", len(stts) if count is None else count) + entries))
+    return _box(b"trak", _box(b"mdia", mdhd + hdlr + _box(b"minf", stbl)))
+
+
+def test_mp4_fps_is_read_from_video_track_boxes(tmp_path: Path) -> None:
+    moov = _box(b"moov", _trak(b"soun", 48000, [(100, 1024)]) + _trak(b"vide", 30000, [(299, 1001), (1, 1001)]))
+    video = tmp_path / "clip.mp4"
+    # moov after mdat, as written by most cameras
+    video.write_bytes(_box(b"ftyp", b"isom" + b"\0" * 4) + _box(b"mdat", b"\0" * 64) + moov)
+
+    assert abs(mp4_video_fps(video) - 30000 / 1001) < 1e-9
+
+
+def test_mp4_fps_returns_none_for_non_mp4(tmp_path: Path) -> None:
+    junk = tmp_path / "clip.mp4"
+    junk.write_bytes(b"not an mp4 at all")
+    assert mp4_video_fps(junk) is None
+    assert mp4_video_fps(tmp_path / "missing.mp4") is None
+
+
+def test_mp4_fps_ignores_corrupt_stts_entry_count(tmp_path: Path) -> None:
+    moov = _box(b"moov", _trak(b"vide", 30, [(90, 1)], count=0xFFFFFFFF))
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(_box(b"ftyp", b"isom" + b"\0" * 4) + moov)
+
+    assert mp4_video_fps(video) == 30
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import dataclasses
 from pathlib import Path
 
 import pytest
 
+from splatflow.backend.paths import AppPaths
 from splatflow.backend.schema import PipelineConfig
+from splatflow.backend.settings import Settings, SettingsStore
 from splatflow.backend.errors import ValidationError
 
 
-def test_defaults_video_enables_sampling_and_sequential(tmp_path: Path) -> None:
-    cfg = PipelineConfig.defaults("video", str(tmp_path / "input.mp4"), str(tmp_path / "out"))
+def test_defaults_video_enables_sampling_and_sequential() -> None:
+    cfg = PipelineConfig.defaults("video", "/nonexistent/input.mp4", "/nonexistent/out")
     assert cfg.frame_sampling.enabled is True
     assert cfg.colmap.matcher == "sequential"
 
 
-def test_validation_rejects_missing_images_dir(tmp_path: Path) -> None:
-    cfg = PipelineConfig.defaults("images", str(tmp_path / "missing"), str(tmp_path / "out"))
+def test_validation_rejects_missing_images_dir() -> None:
+    cfg = PipelineConfig.defaults("images", "/nonexistent/missing", "/nonexistent/out")
+    with pytest.raises(ValidationError):
+        cfg.validate()
+
+
+def test_validation_rejects_unstatable_input_path() -> None:
+    cfg = PipelineConfig.defaults("video", "/nonexistent/in\0put.mp4", "/nonexistent/out")
     with pytest.raises(ValidationError):
         cfg.validate()
 
@@ -31,3 +40,24 @@ def test_validation_rejects_bad_sampling_params(tmp_path: Path) -> None:
     cfg.frame_sampling.num_frames = 0
     with pytest.raises(ValidationError):
         cfg.validate()
+
+
+def test_to_dict_roundtrips_and_does_not_alias() -> None:
+    cfg = PipelineConfig.defaults("video", "/nonexistent/input.mp4", "/nonexistent/out")
+    cfg.lichtfeld.iterations = 1234
+
+    data = cfg.to_dict()
+    assert data == dataclasses.asdict(cfg)
+
+    data["lichtfeld"]["iterations"] = 1
+    assert cfg.lichtfeld.iterations == 1234
+    assert PipelineConfig.from_dict(cfg.to_dict()) == cfg
+
+
+def test_settings_store_roundtrips_form_state(tmp_path: Path) -> None:
+    store = SettingsStore(AppPaths(data_dir_override=str(tmp_path / "data"), config_dir_override=str(tmp_path / "cfg")))
+    assert store.load().form == {}
+
+    settings = Settings(form={"sf_fps": 12, "input_type": "video"}, last_run={"config": "abc", "output_dir": "out"})
+    store.save(settings)
+    assert store.load() == settings